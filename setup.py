@@ -94,6 +94,7 @@ ext_modules = [
         'zipline.finance._finance_ext',
         ['zipline/finance/_finance_ext.pyx'],
     ),
+    Extension('zipline.finance._execution', ['zipline/finance/_execution.pyx']),
     Extension('zipline.gens.sim_engine', ['zipline/gens/sim_engine.pyx']),
     Extension(
         'zipline.data._minute_bar_internal',
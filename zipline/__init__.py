@@ -36,41 +36,119 @@ Usage Guide:
 * Pipeline API: https://qrok.it/dl/z/pipeline
 * Research API: https://qrok.it/dl/z/zipline-research
 """
-import os
-import numpy as np
+import os as _os
+import sys as _sys
 
 # This is *not* a place to dump arbitrary classes/modules for convenience,
 # it is a place to expose the public interfaces.
-from zipline.utils.calendar_utils import get_calendar
+from ._version import get_versions as _get_versions
+from zipline import extensions as ext
+
+# PERF: These are resolved on first attribute access (PEP 562) rather than at
+# import time, so that ``import zipline`` (and in particular the Zipline CLI)
+# doesn't pay for loading the simulation machinery until it's actually used.
+# Values are either a module name or a ``module:attribute`` pair.
+_LAZY_ATTRS = {
+    'get_calendar': 'zipline.utils.calendar_utils:get_calendar',
+    'data': 'zipline.data',
+    'finance': 'zipline.finance',
+    'gens': 'zipline.gens',
+    'utils': 'zipline.utils',
+    'TradingAlgorithm': 'zipline.algorithm:TradingAlgorithm',
+    'api': 'zipline.api',
+    'Blotter': 'zipline.finance.blotter:Blotter',
+}
+
+
+def __getattr__(name):
+    from importlib import import_module
+
+    try:
+        target = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+
+    module_name, _, attr = target.partition(':')
+    value = import_module(module_name)
+    if attr:
+        value = getattr(value, attr)
+
+    # Cache the result so that subsequent lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+# Zipline calendars start in 1980 rather than exchange_calendars' default of
+# 20 years ago. exchange_calendars takes a while to import, so rather than
+# importing it here just to set the default, set it as soon as anything
+# imports it.
+_CALENDAR_DEFAULT_START = '1980-01-01'
+
+
+def _set_calendar_default_start(exchange_calendar):
+    import pandas as pd
+    exchange_calendar.GLOBAL_DEFAULT_START = pd.Timestamp(
+        _CALENDAR_DEFAULT_START,
+    )
 
-from . import data
-from . import finance
-from . import gens
-from . import utils
-from ._version import get_versions
 
-# These need to happen after the other imports.
-from . algorithm import TradingAlgorithm
-from . import api
-from zipline import extensions as ext
-from zipline.finance.blotter import Blotter
+class _CalendarDefaultStartFinder(object):
+    """Meta path finder that sets the calendar default start date once
+    ``exchange_calendars.exchange_calendar`` has been executed.
+    """
+    _name = 'exchange_calendars.exchange_calendar'
+
+    @classmethod
+    def find_spec(cls, fullname, path=None, target=None):
+        if fullname != cls._name:
+            return None
+
+        # only needed once; find the real spec without us on the path
+        _sys.meta_path.remove(cls)
+        from importlib.util import find_spec
+        spec = find_spec(fullname)
+        if spec is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+
+        exec_module = spec.loader.exec_module
+
+        def _exec_module(module):
+            exec_module(module)
+            _set_calendar_default_start(module)
+
+        spec.loader.exec_module = _exec_module
+        return spec
+
+
+_exchange_calendar = _sys.modules.get(_CalendarDefaultStartFinder._name)
+if _exchange_calendar is not None:
+    _set_calendar_default_start(_exchange_calendar)
+else:
+    _sys.meta_path.insert(0, _CalendarDefaultStartFinder)
+
 
 # PERF: Fire a warning if calendars were instantiated during zipline import.
 # Having calendars doesn't break anything per-se, but it makes zipline imports
 # noticeably slower, which becomes particularly noticeable in the Zipline CLI.
-from exchange_calendars.calendar_utils import global_calendar_dispatcher
-if global_calendar_dispatcher._calendars:
-    import warnings
-    warnings.warn(
+# If exchange_calendars hasn't been imported yet there can't be any calendars,
+# so don't import it just to find that out.
+_calendar_utils = _sys.modules.get('exchange_calendars.calendar_utils')
+if (_calendar_utils is not None
+        and _calendar_utils.global_calendar_dispatcher._calendars):
+    import warnings as _warnings
+    _warnings.warn(
         "Found ExchangeCalendar instances after zipline import.\n"
         "Zipline startup will be much slower until this is fixed!",
     )
-    del warnings
-del global_calendar_dispatcher
 
 
-__version__ = get_versions()['version']
-del get_versions
+__version__ = _get_versions()['version']
 
 extension_args = ext.Namespace()
 
@@ -80,7 +158,7 @@ def load_ipython_extension(ipython):
     ipython.register_magic_function(zipline_magic, 'line_cell', 'zipline')
 
 
-if os.name == 'nt':
+if _os.name == 'nt':
     # we need to be able to write to our temp directoy on windows so we
     # create a subdir in %TMP% that has write access and use that as %TMP%
     def _():
@@ -94,19 +172,21 @@ if os.name == 'nt':
             import shutil
             shutil.rmtree(tempdir)
     _()
-    del _
 
-__all__ = [
+__all__ = (
     'api',
     'pipeline',
     'research',
     'data',
     'finance',
-]
+)
 
 
-def setup(self, np=np):
+def setup(self):
     """Lives in zipline.__init__ for doctests."""
+    # numpy is imported here rather than at module scope so that importing
+    # zipline doesn't pay for it.
+    import numpy as np
 
     self.old_opts = np.get_printoptions()
     np.set_printoptions(legacy='1.13')
@@ -115,12 +195,10 @@ def setup(self, np=np):
     np.seterr(all='ignore')
 
 
-def teardown(self, np=np):
+def teardown(self):
     """Lives in zipline.__init__ for doctests."""
+    import numpy as np
 
     np.seterr(**self.old_err)
     np.set_printoptions(**self.old_opts)
 
-
-del os
-del np
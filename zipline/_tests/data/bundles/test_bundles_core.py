@@ -1,4 +1,6 @@
 import os
+import shutil
+from threading import Thread
 
 from parameterized import parameterized
 import pandas as pd
@@ -9,7 +11,14 @@ from zipline.utils.calendar_utils import get_calendar
 
 from zipline.assets.synthetic import make_simple_equity_info
 from zipline.data.bundles import UnknownBundle
-from zipline.data.bundles.core import _make_bundle_core
+from zipline.data.bundles.core import (
+    BundleData,
+    _make_bundle_core,
+    from_bundle_ingest_dirname,
+    ingestions_for_bundle,
+    minute_equity_relative,
+    to_bundle_ingest_dirname,
+)
 from zipline.lib.adjustment import Float64Multiply
 from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
@@ -311,3 +320,180 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             msg='output_dir was not in the bundle directory',
         )
         return _wrote_to[0]
+
+    def test_load_opens_readers_lazily(self):
+        wrote_to = self._empty_ingest()
+
+        # remove the minute bars; nothing should try to read them until the
+        # minute bar reader is requested
+        shutil.rmtree(
+            pth.data_path(
+                minute_equity_relative('bundle', wrote_to),
+                environ=self.environ,
+            ),
+        )
+        bundle = self.load('bundle', environ=self.environ)
+
+        daily_bar_reader = bundle.equity_daily_bar_reader
+        self.assertIs(bundle.equity_daily_bar_reader, daily_bar_reader)
+
+        with self.assertRaises(OSError):
+            bundle.equity_minute_bar_reader
+
+    @parameterized.expand([
+        (pd.Timestamp('2014-01-03 04:05:06'),),
+        (pd.Timestamp('2014-01-03 04:05:06.123456'),),
+        (pd.Timestamp('2014-01-03 04:05:06.123456789'),),
+    ])
+    def test_ingest_dirname_roundtrip(self, ts):
+        assert_equal(
+            from_bundle_ingest_dirname(to_bundle_ingest_dirname(ts)),
+            ts,
+        )
+
+    def test_ingestions_for_bundle(self):
+        wrote_to = [
+            from_bundle_ingest_dirname(os.path.basename(self._empty_ingest()))
+            for _ in range(3)
+        ]
+        expected = sorted(wrote_to, reverse=True)
+
+        assert_equal(
+            ingestions_for_bundle('bundle', environ=self.environ),
+            expected,
+        )
+        assert_equal(
+            ingestions_for_bundle('bundle', environ=self.environ, limit=2),
+            expected[:2],
+        )
+
+    @parameterized.expand([
+        ('naive', pd.Timestamp('2014-01-03 04:05')),
+        ('utc', pd.Timestamp('2014-01-03 04:05', tz='UTC')),
+        ('eastern', pd.Timestamp('2014-01-02 23:05', tz='US/Eastern')),
+    ])
+    def test_ingest_timestamp(self, name, ts):
+        wrote_to = []
+
+        @self.register('bundle', create_writers=False)
+        def _(*args):
+            wrote_to.append(args[-1])
+
+        self.ingest('bundle', environ=self.environ, timestamp=ts)
+        assert_equal(
+            wrote_to,
+            [pth.data_path(['bundle', '2014-01-03T04;05;00'],
+                           environ=self.environ)],
+        )
+
+    def test_load_shares_readers(self):
+        self._empty_ingest()
+
+        first = self.load('bundle', environ=self.environ)
+        second = self.load('bundle', environ=self.environ)
+
+        self.assertIs(first.adjustment_reader, second.adjustment_reader)
+        self.assertIsNot(
+            first.equity_daily_bar_reader,
+            second.equity_daily_bar_reader,
+        )
+
+    def test_bundle_data_namedtuple_interface(self):
+        readers = tuple(object() for _ in range(4))
+        bundle = BundleData(*readers)
+
+        (asset_finder,
+         equity_minute_bar_reader,
+         equity_daily_bar_reader,
+         adjustment_reader) = bundle
+        self.assertIs(asset_finder, bundle.asset_finder)
+        self.assertIs(equity_minute_bar_reader, bundle[1])
+        self.assertIs(equity_daily_bar_reader, bundle.equity_daily_bar_reader)
+        self.assertIs(adjustment_reader, bundle[-1])
+        assert_equal(bundle[:2], readers[:2])
+        assert_equal(len(bundle), 4)
+        assert_equal(
+            bundle._fields,
+            ('asset_finder',
+             'equity_minute_bar_reader',
+             'equity_daily_bar_reader',
+             'adjustment_reader'),
+        )
+        assert_equal(bundle._asdict(), dict(zip(bundle._fields, readers)))
+
+        self.assertEqual(bundle, readers)
+        self.assertEqual(bundle, BundleData(**bundle._asdict()))
+        self.assertEqual(hash(bundle), hash(BundleData(*readers)))
+
+        replaced = bundle._replace(adjustment_reader=None)
+        self.assertIsNone(replaced.adjustment_reader)
+        self.assertIs(replaced.asset_finder, asset_finder)
+        self.assertNotEqual(replaced, bundle)
+        with self.assertRaises(ValueError):
+            bundle._replace(not_a_field=None)
+
+    def test_load_unpacks(self):
+        self._empty_ingest()
+        bundle = self.load('bundle', environ=self.environ)
+
+        # unpacking a loaded bundle opens its readers
+        minute_bar_reader, daily_bar_reader, adjustment_reader = bundle[1:]
+        self.assertIs(minute_bar_reader, bundle.equity_minute_bar_reader)
+        self.assertIs(daily_bar_reader, bundle.equity_daily_bar_reader)
+        self.assertIs(adjustment_reader, bundle.adjustment_reader)
+
+    def test_adjustment_readers_not_shared_across_threads(self):
+        self._empty_ingest()
+
+        readers = []
+
+        def load():
+            bundle = self.load('bundle', environ=self.environ)
+            readers.append(bundle.adjustment_reader)
+
+        # run the threads one after the other so the later ones are likely
+        # to be given an earlier one's (no longer used) thread ident
+        for _ in range(3):
+            thread = Thread(target=load)
+            thread.start()
+            thread.join()
+
+        assert_equal(len(set(map(id, readers))), 3)
+
+    def test_most_recent_data_skips_non_ingestions(self):
+        wrote_to = self._empty_ingest()
+
+        # directories that aren't ingestions sort after the timestamps but
+        # aren't mistaken for the most recent ingestion
+        os.mkdir(pth.data_path(['bundle', 'tmp'], environ=self.environ))
+        bundle = self.load('bundle', environ=self.environ)
+        assert_equal(bundle._timestr, wrote_to)
+
+    def test_most_recent_data_out_of_order_ingests(self):
+        self.register('bundle', lambda *args: None, create_writers=False)
+
+        def ingestion_path(ts):
+            return pth.data_path(
+                ['bundle', to_bundle_ingest_dirname(ts)],
+                environ=self.environ,
+            )
+
+        newer = pd.Timestamp('2014-01-03')
+        older = pd.Timestamp('2014-01-02')
+
+        # the older ingestion finishes last
+        self.ingest('bundle', environ=self.environ, timestamp=newer)
+        self.ingest('bundle', environ=self.environ, timestamp=older)
+        assert_equal(
+            self.load('bundle', environ=self.environ)._timestr,
+            ingestion_path(newer),
+        )
+
+        # an ingestion that shows up without being ingested, e.g. from a
+        # backup, is found too
+        restored = pd.Timestamp('2014-01-04')
+        shutil.copytree(ingestion_path(older), ingestion_path(restored))
+        assert_equal(
+            self.load('bundle', environ=self.environ)._timestr,
+            ingestion_path(restored),
+        )
@@ -403,7 +403,12 @@ class ClassifierTestCase(BaseUSEquityPipelineTestCase):
 
         terms = {}
         expected = {}
-        for choices in [(0,), (0, 1), (0, 1, 2)]:
+        # Small sets of choices are checked with numexpr, and larger ones with
+        # a lookup table unless they span too wide a range, in which case they
+        # are binary searched.
+        for choices in [(), (0,), (0, 1), (0, 1, 2), (-5, 3),
+                        (-5, 0, 1, 2, 3), (-5, 0, 1, 2, 1 << 40),
+                        (1, 1 << 70)]:
             terms[str(choices)] = c.isin(choices)
             expected[str(choices)] = reduce(
                 op.or_,
@@ -719,6 +724,15 @@ class TestPostProcessAndToWorkSpaceValue(ZiplineTestCase):
             column_data,
         )
 
+        # the missing value may already be one of the output's categories
+        assert_equal(
+            f.to_workspace_value(
+                pipeline_output.cat.add_categories([f.missing_value]),
+                pd.Index([0, 1]),
+            ),
+            column_data,
+        )
+
     def test_reversability_int64(self):
         class F(Classifier):
             inputs = ()
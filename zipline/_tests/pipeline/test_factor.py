@@ -1410,6 +1410,33 @@ class FactorTestCase(BaseUSEquityPipelineTestCase):
             mask=self.build_mask(self.ones_mask(shape=shape)),
         )
 
+    def test_quantiles_nans_after_complete_row(self):
+        # The first row has no missing values. The labels of later rows
+        # shouldn't depend on that.
+        factor_data = array([[1.0, 2.0, 3.0, 4.0],
+                             [1.0, nan, 3.0, 4.0],
+                             [1.0, 2.0, 3.0, 4.0]])
+        mask_data = array([[True, True, True, True],
+                           [True, True, True, True],
+                           [True, True, False, True]])
+
+        f = F()
+        m = Mask()
+
+        self.check_terms(
+            terms={'2_masked': f.quantiles(bins=2, mask=m)},
+            initial_workspace={
+                f: factor_data,
+                m: mask_data,
+            },
+            expected={
+                '2_masked': array([[0, 0, 1, 1],
+                                   [0, -1, 0, 1],
+                                   [0, 0, -1, 1]], dtype=int64_dtype),
+            },
+            mask=self.build_mask(self.ones_mask(shape=factor_data.shape)),
+        )
+
     def test_quantile_helpers(self):
         f = self.f
         m = Mask()
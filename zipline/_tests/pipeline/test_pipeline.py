@@ -638,6 +638,40 @@ class InitialUniverseTestCase(zf.WithAssetFinder, zf.ZiplineTestCase):
                 },
             ]})
 
+    def test_prescreen_not_shared(self):
+        """
+        Tests that pipelines with equal initial_universes don't share prescreens.
+        """
+        assets = self.asset_finder.retrieve_all([65, 66])
+
+        def make_universe():
+            return (
+                StaticAssets(assets)
+                & SecuritiesMaster.Symbol.latest.isin(["MDY", "SPY"]))
+
+        pipe = Pipeline(initial_universe=make_universe())
+        other_pipe = Pipeline(initial_universe=make_universe())
+
+        pipe._prescreen["sids"].append(67)
+        pipe._prescreen["fields"][0]["values"].append("QQQ")
+        pipe._prescreen["fields"][0]["negate"] = True
+
+        self.assert_prescreen_dict_equal(
+            other_pipe._prescreen,
+            {"sids": [65, 66],
+             "fields": [
+                {
+                    "field": "Symbol",
+                    "op": "eq",
+                    "negate": False,
+                    "values": ["MDY", "SPY"]
+                },
+            ]})
+        self.assert_prescreen_dict_equal(
+            Pipeline(initial_universe=make_universe())._prescreen,
+            other_pipe._prescreen,
+        )
+
     def test_initial_universe_with_screen(self):
         """
         Tests applying an initial_universe with a screen.
@@ -723,3 +757,11 @@ class InitialUniverseTestCase(zf.WithAssetFinder, zf.ZiplineTestCase):
                 initial_universe=(
                     SecuritiesMaster.Symbol.latest.fillna("A").eq("A")),
             )
+
+        # inverting an ANDed securities master screen is not supported
+        with self.assertRaises(ValueError):
+            Pipeline(
+                columns={'f': SomeFactor()},
+                initial_universe=~(
+                    SecuritiesMaster.Etf.latest & SecuritiesMaster.Exchange.latest.eq("NYSE")),
+            )
@@ -1,5 +1,8 @@
 from datetime import time
+from functools import lru_cache
+from itertools import zip_longest
 from unittest import TestCase
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_index_equal
 from zipline.utils.calendar_utils import get_calendar, days_at_time
@@ -13,64 +16,228 @@ from zipline.gens.sim_engine import (
 )
 
 
-class TestClock(TestCase):
-    @classmethod
-    def setUpClass(cls):
-        cls.nyse_calendar = get_calendar("NYSE")
+@lru_cache(maxsize=16)
+def _bts_minutes(session_nanos, bts_time, tz):
+    sessions = pd.DatetimeIndex(np.asarray(session_nanos, dtype="datetime64[ns]"))
+    return days_at_time(sessions, bts_time, tz, day_offset=0)
 
-        # july 15 is friday, so there are 3 sessions in this range (15, 18, 19)
-        cls.sessions = cls.nyse_calendar.sessions_in_range(
-            pd.Timestamp("2016-07-15"),
-            pd.Timestamp("2016-07-19")
-        )
 
-        cls.opens = cls.nyse_calendar.first_minutes.loc[cls.sessions]
-        cls.closes = cls.nyse_calendar.schedule.loc[
-            cls.sessions, "close"
-        ]
+def bts_minutes(sessions, bts_time, tz):
+    """Memoized ``days_at_time`` for the fixed test sessions."""
+    return _bts_minutes(tuple(sessions.asi8), bts_time, tz)
 
-        cls.break_starts = cls.nyse_calendar.last_am_minutes.loc[cls.sessions]
-        cls.break_ends = cls.nyse_calendar.first_pm_minutes.loc[cls.sessions]
 
-    def test_bts_before_session(self):
-        clock = MinuteSimulationClock(
-            self.sessions,
-            self.opens,
-            self.closes,
-            days_at_time(self.sessions, time(6, 17), "US/Eastern", day_offset=0),
-            self.break_starts,
-            self.break_ends,
-            False
-        )
+def run_clock(*args):
+    """Build a MinuteSimulationClock and drain all of its events."""
+    return list(MinuteSimulationClock(*args))
+
+
+def run_clock_arrays(*args):
+    """Build a MinuteSimulationClock and return its events as arrays."""
+    return MinuteSimulationClock(*args).as_arrays()
+
+
+def expected_events(sessions, session_minutes, bts_minutes):
+    """Generate the events a clock without minute emission should produce,
+    one session at a time.
+    """
+    for session, bts in zip(sessions, bts_minutes):
+        minutes = pd.DatetimeIndex(session_minutes[session], tz="UTC")
 
-        all_events = list(clock)
+        yield session.tz_localize("UTC"), SESSION_START
 
-        def _check_session_bts_first(session_label, events, bts_dt):
-            minutes = self.nyse_calendar.session_minutes(session_label)
+        bts_pending = bts <= minutes[-1]
+        for minute in minutes:
+            if bts_pending and minute >= bts:
+                yield bts, BEFORE_TRADING_START_BAR
+                bts_pending = False
+            yield minute, BAR
 
-            self.assertEqual(393, len(events))
+        yield minutes[-1], SESSION_END
+
+
+def split_sessions(events, session_length):
+    """Split the ``(times, codes)`` arrays of a clock run into per-session
+    chunks of ``session_length`` events.
+    """
+    times, codes = events
+    return [
+        (times[i:i + session_length], codes[i:i + session_length])
+        for i in range(0, len(times), session_length)
+    ]
+
+
+def session_nanos(calendar, sessions):
+    """Build an (N, 5) int64 buffer of session labels, opens, closes, break
+    starts and break ends, in nanoseconds since the epoch.
+    """
+    # All of these columns share the schedule's index, so look the sessions
+    # up once and index positionally.
+    idx = calendar.schedule.index.get_indexer(sessions)
+    return np.stack([
+        sessions.asi8,
+        calendar.first_minutes.values.view("i8")[idx],
+        calendar.schedule["close"].values.view("i8")[idx],
+        calendar.last_am_minutes.values.view("i8")[idx],
+        calendar.first_pm_minutes.values.view("i8")[idx],
+    ], axis=1)
+
+
+def session_bounds(nanos):
+    """UTC views of the opens, closes, break starts and break ends columns
+    of a ``session_nanos`` buffer.
+    """
+    return tuple(
+        pd.DatetimeIndex(nanos[:, i].view("datetime64[ns]")).tz_localize("UTC")
+        for i in range(1, 5)
+    )
+
+
+# Calendar fixtures shared by every test class in this module, built once in
+# setUpModule.
+NYSE_CALENDAR = NYSE_SESSIONS = NYSE_SESSION_MINUTES = NYSE_NANOS = None
+XTKS_CALENDAR = XTKS_SESSIONS = XTKS_NANOS = None
+
+
+def setUpModule():
+    global NYSE_CALENDAR, NYSE_SESSIONS, NYSE_SESSION_MINUTES, NYSE_NANOS
+    global XTKS_CALENDAR, XTKS_SESSIONS, XTKS_NANOS
+
+    NYSE_CALENDAR = get_calendar("NYSE")
+
+    # july 15 is friday, so there are 3 sessions in this range (15, 18, 19)
+    NYSE_SESSIONS = NYSE_CALENDAR.sessions_in_range(
+        pd.Timestamp("2016-07-15"),
+        pd.Timestamp("2016-07-19")
+    )
+
+    NYSE_SESSION_MINUTES = {
+        session: NYSE_CALENDAR.session_minutes(session).values
+        for session in NYSE_SESSIONS
+    }
+
+    NYSE_NANOS = session_nanos(NYSE_CALENDAR, NYSE_SESSIONS)
+
+    XTKS_CALENDAR = get_calendar("XTKS")
+
+    XTKS_SESSIONS = XTKS_CALENDAR.sessions_in_range(
+        pd.Timestamp("2021-06-14"),
+        pd.Timestamp("2021-06-15")
+    )
+
+    XTKS_NANOS = session_nanos(XTKS_CALENDAR, XTKS_SESSIONS)
+
+
+@lru_cache(maxsize=None)
+def nyse_clock(bts_time):
+    """The events of a NYSE clock with ``bts_time`` as its
+    before_trading_start time, built the first time a test asks for them.
+    """
+    opens, closes, break_starts, break_ends = session_bounds(NYSE_NANOS)
+    return run_clock_arrays(
+        NYSE_SESSIONS,
+        opens,
+        closes,
+        bts_minutes(NYSE_SESSIONS, bts_time, "US/Eastern"),
+        break_starts,
+        break_ends,
+        False,
+    )
+
+
+@lru_cache(maxsize=None)
+def xtks_clock():
+    """The events of the XTKS clock, built the first time a test asks for
+    them.
+    """
+    opens, closes, break_starts, break_ends = session_bounds(XTKS_NANOS)
+    return run_clock(
+        XTKS_SESSIONS,
+        opens,
+        closes,
+        bts_minutes(XTKS_SESSIONS, time(8, 45), "Japan"),
+        break_starts,
+        break_ends,
+        False,
+    )
 
-            self.assertEqual(events[0], (session_label.tz_localize("UTC"), SESSION_START))
-            self.assertEqual(events[1], (bts_dt, BEFORE_TRADING_START_BAR))
-            for i in range(2, 392):
-                self.assertEqual(events[i], (minutes[i - 2], BAR))
-            self.assertEqual(events[392], (minutes[-1], SESSION_END))
+
+class TestClock(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.nyse_calendar = NYSE_CALENDAR
+        cls.sessions = NYSE_SESSIONS
+        cls.sessions_utc = cls.sessions.tz_localize("UTC")
+        cls.session_minutes = NYSE_SESSION_MINUTES
+
+        cls.nyse_nanos = NYSE_NANOS
+        (
+            cls.opens,
+            cls.closes,
+            cls.break_starts,
+            cls.break_ends,
+        ) = session_bounds(cls.nyse_nanos)
+
+        cls.xtks_calendar = XTKS_CALENDAR
+        cls.xtks_sessions = XTKS_SESSIONS
+
+        cls.xtks_nanos = XTKS_NANOS
+        (
+            cls.xtks_opens,
+            cls.xtks_closes,
+            cls.xtks_break_starts,
+            cls.xtks_break_ends,
+        ) = session_bounds(cls.xtks_nanos)
+
+    def assert_events_equal(self, events, expected_times, expected_codes):
+        """Compare a run of clock events against expected times and codes."""
+        times, codes = events
+        np.testing.assert_array_equal(
+            times,
+            np.asarray(expected_times, dtype="datetime64[ns]"),
+        )
+        np.testing.assert_array_equal(
+            codes,
+            np.asarray(expected_codes, dtype=np.int8),
+        )
+
+    def test_bts_before_session(self):
+        all_events = split_sessions(nyse_clock(time(6, 17)), 393)
+        self.assertEqual(len(all_events), 3)
+
+        def _check_session_bts_first(session_idx, events, bts_dt):
+            minutes = self.session_minutes[self.sessions[session_idx]]
+
+            self.assertEqual(393, len(events[0]))
+
+            self.assert_events_equal(
+                events,
+                np.concatenate([
+                    [self.sessions_utc[session_idx].to_datetime64()],
+                    [bts_dt.tz_convert(None).to_datetime64()],
+                    minutes,
+                    minutes[-1:],
+                ]),
+                [SESSION_START, BEFORE_TRADING_START_BAR]
+                + [BAR] * 390
+                + [SESSION_END],
+            )
 
         _check_session_bts_first(
-            self.sessions[0],
-            all_events[0:393],
+            0,
+            all_events[0],
             pd.Timestamp("2016-07-15 6:17", tz='US/Eastern')
         )
 
         _check_session_bts_first(
-            self.sessions[1],
-            all_events[393:786],
+            1,
+            all_events[1],
             pd.Timestamp("2016-07-18 6:17", tz='US/Eastern')
         )
 
         _check_session_bts_first(
-            self.sessions[2],
-            all_events[786:],
+            2,
+            all_events[2],
             pd.Timestamp("2016-07-19 6:17", tz='US/Eastern')
         )
 
@@ -105,130 +272,167 @@ class TestClock(TestCase):
         )
 
     def verify_bts_during_session(self, bts_time, bts_session_times, bts_idx):
-        def _check_session_bts_during(session_label, events, bts_dt):
-            minutes = self.nyse_calendar.session_minutes(session_label)
-
-            self.assertEqual(393, len(events))
-
-            self.assertEqual(events[0], (session_label.tz_localize("UTC"), SESSION_START))
-
-            for i in range(1, bts_idx):
-                self.assertEqual(events[i], (minutes[i - 1], BAR))
-
-            self.assertEqual(
-                events[bts_idx],
-                (bts_dt, BEFORE_TRADING_START_BAR)
+        def _check_session_bts_during(session_idx, events, bts_dt):
+            minutes = self.session_minutes[self.sessions[session_idx]]
+
+            self.assertEqual(393, len(events[0]))
+
+            self.assert_events_equal(
+                events,
+                np.concatenate([
+                    [self.sessions_utc[session_idx].to_datetime64()],
+                    minutes[:bts_idx - 1],
+                    [bts_dt.tz_convert(None).to_datetime64()],
+                    minutes[bts_idx - 1:],
+                    minutes[-1:],
+                ]),
+                [SESSION_START]
+                + [BAR] * (bts_idx - 1)
+                + [BEFORE_TRADING_START_BAR]
+                + [BAR] * (391 - bts_idx)
+                + [SESSION_END],
             )
 
-            for i in range(bts_idx + 1, 391):
-                self.assertEqual(events[i], (minutes[i - 2], BAR))
-
-            self.assertEqual(events[392], (minutes[-1], SESSION_END))
-
-        clock = MinuteSimulationClock(
-            self.sessions,
-            self.opens,
-            self.closes,
-            days_at_time(self.sessions, bts_time, "US/Eastern", day_offset=0),
-            self.break_starts,
-            self.break_ends,
-            False
-        )
-
-        all_events = list(clock)
+        all_events = split_sessions(nyse_clock(bts_time), 393)
+        self.assertEqual(len(all_events), 3)
 
         _check_session_bts_during(
-            self.sessions[0],
-            all_events[0:393],
+            0,
+            all_events[0],
             bts_session_times[0]
         )
 
         _check_session_bts_during(
-            self.sessions[1],
-            all_events[393:786],
+            1,
+            all_events[1],
             bts_session_times[1]
         )
 
         _check_session_bts_during(
-            self.sessions[2],
-            all_events[786:],
+            2,
+            all_events[2],
             bts_session_times[2]
         )
 
     def test_bts_after_session(self):
-        clock = MinuteSimulationClock(
-            self.sessions,
-            self.opens,
-            self.closes,
-            days_at_time(self.sessions, time(19, 5), "US/Eastern", day_offset=0),
-            self.break_starts,
-            self.break_ends,
-            False
-        )
-
-        all_events = list(clock)
+        all_events = split_sessions(nyse_clock(time(19, 5)), 392)
 
         # since 19:05 Eastern is after the NYSE is closed, we don't emit
         # BEFORE_TRADING_START.  therefore, each day has SESSION_START,
         # 390 BARs, and then SESSION_END
 
-        def _check_session_bts_after(session_label, events):
-            minutes = self.nyse_calendar.session_minutes(session_label)
-
-            self.assertEqual(392, len(events))
-            self.assertEqual(events[0], (session_label.tz_localize("UTC"), SESSION_START))
+        def _check_session_bts_after(session_idx, events):
+            minutes = self.session_minutes[self.sessions[session_idx]]
 
-            for i in range(1, 391):
-                self.assertEqual(events[i], (minutes[i - 1], BAR))
+            self.assertEqual(392, len(events[0]))
 
-            self.assertEqual(events[-1], (minutes[389], SESSION_END))
+            self.assert_events_equal(
+                events,
+                np.concatenate([
+                    [self.sessions_utc[session_idx].to_datetime64()],
+                    minutes,
+                    minutes[-1:],
+                ]),
+                [SESSION_START] + [BAR] * 390 + [SESSION_END],
+            )
 
         for i in range(0, 2):
             _check_session_bts_after(
-                self.sessions[i],
-                all_events[(i * 392): ((i + 1) * 392)]
+                i,
+                all_events[i]
             )
 
     def test_market_breaks(self):
-
-        calendar = get_calendar("XTKS")
-
-        sessions = calendar.sessions_in_range(
-            pd.Timestamp("2021-06-14"),
-            pd.Timestamp("2021-06-15")
-        )
-
-        opens = calendar.first_minutes.loc[sessions]
-        closes = calendar.schedule.loc[
-            sessions, "close"
-        ]
-
-        break_starts = calendar.last_am_minutes.loc[sessions]
-        break_ends = calendar.first_pm_minutes.loc[sessions]
-
-        clock = MinuteSimulationClock(
-            sessions,
-            opens,
-            closes,
-            days_at_time(sessions, time(8, 45), "Japan", day_offset=0),
-            break_starts,
-            break_ends,
-            False
-        )
-
-        all_events = list(clock)
-        all_events = pd.DataFrame(all_events, columns=["date", "event"]).set_index("date")
-        bar_events = all_events[all_events.event == BAR]
+        times, codes = zip(*xtks_clock())
+        times = pd.DatetimeIndex(times)
+        bar_times = times[np.asarray(codes) == BAR]
 
         # XTKS is open 9am - 3pm with a 1 hour lunch break from 11:30am - 12:30pm
         # 2 days x 300 minutes per day
-        self.assertEqual(len(bar_events), 600)
+        self.assertEqual(len(bar_times), 600)
 
         assert_index_equal(
-            bar_events.tz_convert("Japan").iloc[148:152].index,
+            bar_times.tz_convert("Japan")[148:152],
             pd.DatetimeIndex(
                 ['2021-06-14 11:29:00',
                 '2021-06-14 11:30:00',
                 '2021-06-14 12:31:00',
-                '2021-06-14 12:32:00'], tz="Japan", name="date")
+                '2021-06-14 12:32:00'], tz="Japan")
+        )
+
+    def test_as_arrays_matches_iter(self):
+        for minute_emission in (False, True):
+            for calendar, args in [
+                ("NYSE", (
+                    self.sessions,
+                    self.opens,
+                    self.closes,
+                    bts_minutes(self.sessions, time(11, 45), "US/Eastern"),
+                    self.break_starts,
+                    self.break_ends,
+                )),
+                ("XTKS", (
+                    self.xtks_sessions,
+                    self.xtks_opens,
+                    self.xtks_closes,
+                    bts_minutes(self.xtks_sessions, time(8, 45), "Japan"),
+                    self.xtks_break_starts,
+                    self.xtks_break_ends,
+                )),
+            ]:
+                with self.subTest(
+                    calendar=calendar, minute_emission=minute_emission,
+                ):
+                    expected = run_clock(*args, minute_emission)
+                    times, codes = run_clock_arrays(*args, minute_emission)
+
+                    self.assertEqual(times.dtype, np.dtype("datetime64[ns]"))
+                    self.assertEqual(codes.dtype, np.dtype(np.int8))
+                    self.assertEqual(
+                        list(zip(pd.DatetimeIndex(times, tz="UTC"), codes)),
+                        expected,
+                    )
+
+    def test_iter_streams_expected_events(self):
+        for bts_time in [
+            time(6, 17),
+            time(9, 30),
+            time(11, 45),
+            time(16, 00),
+            time(19, 5),
+        ]:
+            with self.subTest(bts_time=bts_time):
+                bts = bts_minutes(self.sessions, bts_time, "US/Eastern")
+                clock = MinuteSimulationClock(
+                    self.sessions,
+                    self.opens,
+                    self.closes,
+                    bts,
+                    self.break_starts,
+                    self.break_ends,
+                    False
+                )
+
+                # check each event as the clock emits it
+                for actual, expected in zip_longest(
+                    clock,
+                    expected_events(self.sessions, self.session_minutes, bts),
+                ):
+                    self.assertEqual(actual, expected)
+
+    def test_empty_session(self):
+        # a session that closes before it opens has no minutes
+        args = (
+            self.sessions[:1],
+            self.opens[:1],
+            self.opens[:1] - pd.Timedelta(minutes=1),
+            bts_minutes(self.sessions[:1], time(6, 17), "US/Eastern"),
+            self.break_starts[:1],
+            self.break_ends[:1],
         )
+        for minute_emission in (False, True):
+            with self.subTest(minute_emission=minute_emission):
+                with self.assertRaises(IndexError):
+                    run_clock(*args, minute_emission)
+                with self.assertRaises(IndexError):
+                    run_clock_arrays(*args, minute_emission)
@@ -14,6 +14,7 @@
 # limitations under the License.
 from parameterized import parameterized
 from six.moves import range
+import numpy as np
 import pandas as pd
 
 from zipline.errors import BadOrderParameters
@@ -26,6 +27,8 @@ from zipline.finance.execution import (
     LimitOnOpenOrder,
     MarketOnCloseOrder,
     LimitOnCloseOrder,
+    asymmetric_round_price,
+    asymmetric_round_prices,
 )
 from zipline._testing.fixtures import (
     ZiplineTestCase,
@@ -268,3 +271,90 @@ class ExecutionStyleTestCase(WithConstantFutureMinuteBarData,
         assert_equal(LimitOnOpenOrder(1).tif, "OPG")
         assert_equal(MarketOnCloseOrder().tif, "CLS")
         assert_equal(LimitOnCloseOrder(1).tif, "CLS")
+
+    @parameterized.expand([
+        ('price', EXPECTED_PRICE_ROUNDING, 0.01),
+        ('precision', EXPECTED_PRECISION_ROUNDING, 0.0001),
+        ('custom_tick_size', EXPECTED_CUSTOM_TICK_SIZE_ROUNDING, 0.05),
+    ])
+    def test_asymmetric_round_prices(self, name, cases, tick_size):
+        """
+        Test that the vectorized rounding matches the scalar rounding exactly.
+        """
+        prices, expected_round_down, expected_round_up = map(
+            np.array, zip(*cases),
+        )
+
+        for prefer_round_down, expected in ((True, expected_round_down),
+                                            (False, expected_round_up)):
+            result = asymmetric_round_prices(
+                prices, prefer_round_down, tick_size,
+            )
+            assert_equal(
+                result,
+                np.array([
+                    asymmetric_round_price(price, prefer_round_down, tick_size)
+                    for price in prices
+                ]),
+            )
+            assert_equal(result, expected, array_decimal=7)
+
+    def test_rounding_follows_asset(self):
+        """
+        Test that assigning an asset after construction rounds to its tick
+        size.
+        """
+        style = StopLimitOrder(1.0475, 1.0475)
+        assert_equal(style.get_limit_price(is_buy=True), 1.04)
+        assert_equal(style.get_stop_price(is_buy=False), 1.04)
+
+        style.asset = self.asset_finder.retrieve_asset(3)
+        assert_equal(style.get_limit_price(is_buy=True), 1.05)
+        assert_equal(style.get_stop_price(is_buy=False), 1.05)
+
+    def test_rounding_follows_prices(self):
+        """
+        Test that assigning new prices after construction re-rounds them.
+        """
+        asset = self.asset_finder.retrieve_asset(3)
+
+        style = LimitOrder(1.0475, asset=asset)
+        style.limit_price = 2.0475
+        assert_equal(style.limit_price, 2.0475)
+        assert_equal(style.get_limit_price(is_buy=True), 2.05)
+
+        style = StopOrder(1.0475, asset=asset)
+        style.stop_price = 2.0475
+        assert_equal(style.stop_price, 2.0475)
+        assert_equal(style.get_stop_price(is_buy=False), 2.05)
+
+        style = StopLimitOrder(1.0475, 1.0475, asset=asset)
+        style.limit_price = 2.0475
+        style.stop_price = 3.0475
+        assert_equal(style.get_limit_price(is_buy=True), 2.05)
+        assert_equal(style.get_stop_price(is_buy=False), 3.05)
+
+        # and the new prices still follow the asset's tick size
+        style.asset = None
+        assert_equal(style.get_limit_price(is_buy=True), 2.04)
+        assert_equal(style.get_stop_price(is_buy=False), 3.04)
+
+    def test_numpy_prices(self):
+        """
+        Test that prices can be numpy scalars or 0-d arrays.
+        """
+        for price in (np.array(10.013), np.float64(10.013), np.int64(10)):
+            style = StopLimitOrder(price, price)
+            expected = (
+                asymmetric_round_price(float(price), False, 0.01),
+                asymmetric_round_price(float(price), True, 0.01),
+            )
+            assert_equal(style.get_limit_price(is_buy=False), expected[0])
+            assert_equal(style.get_limit_price(is_buy=True), expected[1])
+            assert_equal(style.get_stop_price(is_buy=True), expected[0])
+            assert_equal(style.get_stop_price(is_buy=False), expected[1])
+
+        for price in (10, 10.0, np.float64(10), np.array(10)):
+            style = LimitOrder(price)
+            assert_equal(style.get_limit_price(is_buy=True), 10.0)
+            assert_equal(style.get_limit_price(is_buy=False), 10.0)
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+
+class CalendarDefaultStartTestCase(TestCase):
+    """
+    Tests that importing zipline sets the exchange_calendars default start
+    date, whether exchange_calendars is imported before or after zipline.
+    """
+
+    def check_default_start(self, code):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "1980-01-01 00:00:00")
+
+    def test_exchange_calendars_imported_after_zipline(self):
+        self.check_default_start(
+            "import sys\n"
+            "import zipline\n"
+            "assert 'exchange_calendars' not in sys.modules\n"
+            "from exchange_calendars import exchange_calendar\n"
+            "print(exchange_calendar.GLOBAL_DEFAULT_START)\n"
+        )
+
+    def test_exchange_calendars_imported_before_zipline(self):
+        self.check_default_start(
+            "from exchange_calendars import exchange_calendar\n"
+            "import zipline\n"
+            "print(exchange_calendar.GLOBAL_DEFAULT_START)\n"
+        )
+
+    def test_calendars_start_in_1980(self):
+        self.check_default_start(
+            "import zipline\n"
+            "import exchange_calendars\n"
+            "calendar = exchange_calendars.get_calendar('XNYS')\n"
+            "print(calendar.first_session.replace(day=1))\n"
+        )
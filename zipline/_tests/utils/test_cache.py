@@ -1,8 +1,16 @@
-from unittest import TestCase
+from importlib.util import find_spec
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
 
-from pandas import Timestamp, Timedelta
+from pandas import DataFrame, Timestamp, Timedelta, date_range
+from pandas.testing import assert_frame_equal
 
-from zipline.utils.cache import CachedObject, Expired, ExpiringCache
+from zipline.utils.cache import (
+    CachedObject,
+    Expired,
+    ExpiringCache,
+    dataframe_cache,
+)
 
 
 class CachedObjectTestCase(TestCase):
@@ -65,3 +73,32 @@ class ExpiringCacheTestCase(TestCase):
         with self.assertRaises(KeyError) as e:
             self.assertEqual(cache.get('baz', expiry_3))
         self.assertEqual(e.exception.args, ('baz',))
+
+
+class DataFrameCacheTestCase(TestCase):
+
+    def make_frame(self):
+        return DataFrame(
+            {'a': [1.0, 2.0, 3.0], 'b': [1, 2, 3]},
+            index=date_range('2014-01-02', periods=3, tz='UTC'),
+        )
+
+    def test_pickle_roundtrip(self):
+        df = self.make_frame()
+        with dataframe_cache(serialization='pickle:3') as cache:
+            cache['df'] = df
+            assert_frame_equal(cache['df'], df)
+
+    @skipUnless(find_spec('pyarrow') is not None, 'pyarrow is not installed')
+    def test_parquet_roundtrip(self):
+        df = self.make_frame()
+        with dataframe_cache(serialization='parquet') as cache:
+            cache['df'] = df
+            assert_frame_equal(cache['df'], df)
+
+            with self.assertRaises(KeyError):
+                cache['missing']
+
+    def test_invalid_serialization(self):
+        with TemporaryDirectory() as path, self.assertRaises(ValueError):
+            dataframe_cache(path=path, serialization='msgpack')
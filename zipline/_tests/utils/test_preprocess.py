@@ -5,9 +5,7 @@ from operator import attrgetter
 from types import FunctionType
 from unittest import TestCase
 
-from parameterized import parameterized
 import pytz
-from six import PY3
 
 from zipline.utils.preprocess import call, preprocess
 
@@ -17,22 +15,38 @@ def noop(func, argname, argvalue):
     return argvalue
 
 
-if PY3:
-    qualname = attrgetter('__qualname__')
-else:
-    def qualname(ob):
-        return '.'.join((__name__, ob.__name__))
+qualname = attrgetter('__qualname__')
+
+# (args, kwargs) pairs that should all resolve to a=1, b=2, c=3.
+ARGS_ABC = [
+    ((1, 2), {}),
+    ((1, 2), {'c': 3}),
+    ((1,), {'b': 2}),
+    ((), {'a': 1, 'b': 2}),
+    ((), {'a': 1, 'b': 2, 'c': 3}),
+]
+
+
+@preprocess(a=call(str), b=call(float), c=call(lambda x: x + 1))
+def _preproc_func(a, b, c=3):
+    return a, b, c
+
+
+class _PreprocFoo(object):
+
+    @preprocess(a=call(str), b=call(float), c=call(lambda x: x + 1))
+    def method(self, a, b, c=3):
+        return a, b, c
+
+    @classmethod
+    @preprocess(a=call(str), b=call(float), c=call(lambda x: x + 1))
+    def clsmeth(cls, a, b, c=3):
+        return a, b, c
 
 
 class PreprocessTestCase(TestCase):
 
-    @parameterized.expand([
-        ('too_many', (1, 2, 3), {}),
-        ('too_few', (1,), {}),
-        ('collision', (1,), {'a': 1}),
-        ('unexpected', (1,), {'q': 1}),
-    ])
-    def test_preprocess_doesnt_change_TypeErrors(self, name, args, kwargs):
+    def test_preprocess_doesnt_change_TypeErrors(self):
         """
         Verify that the validate decorator doesn't swallow typeerrors that
         would be raised when calling a function with invalid arguments
@@ -42,18 +56,25 @@ class PreprocessTestCase(TestCase):
 
         decorated = preprocess(x=noop, y=noop)(undecorated)
 
-        with self.assertRaises(TypeError) as e:
-            undecorated(*args, **kwargs)
-        undecorated_errargs = e.exception.args
+        for name, args, kwargs in [
+            ('too_many', (1, 2, 3), {}),
+            ('too_few', (1,), {}),
+            ('collision', (1,), {'a': 1}),
+            ('unexpected', (1,), {'q': 1}),
+        ]:
+            with self.subTest(name=name):
+                with self.assertRaises(TypeError) as e:
+                    undecorated(*args, **kwargs)
+                undecorated_errargs = e.exception.args
 
-        with self.assertRaises(TypeError) as e:
-            decorated(*args, **kwargs)
-        decorated_errargs = e.exception.args
+                with self.assertRaises(TypeError) as e:
+                    decorated(*args, **kwargs)
+                decorated_errargs = e.exception.args
 
-        self.assertEqual(len(decorated_errargs), 1)
-        self.assertEqual(len(undecorated_errargs), 1)
+                self.assertEqual(len(decorated_errargs), 1)
+                self.assertEqual(len(undecorated_errargs), 1)
 
-        self.assertEqual(decorated_errargs[0], undecorated_errargs[0])
+                self.assertEqual(decorated_errargs[0], undecorated_errargs[0])
 
     def test_preprocess_co_filename(self):
 
@@ -67,6 +88,13 @@ class PreprocessTestCase(TestCase):
             decorated.__code__.co_filename,
         )
 
+    def test_preprocess_no_processors_returns_function(self):
+
+        def undecorated():
+            pass
+
+        self.assertIs(preprocess()(undecorated), undecorated)
+
     def test_preprocess_preserves_docstring(self):
 
         @preprocess()
@@ -83,20 +111,15 @@ class PreprocessTestCase(TestCase):
 
         self.assertEqual(arglebargle.__name__, 'arglebargle')
 
-    @parameterized.expand([
-        ((1, 2), {}),
-        ((1, 2), {'c': 3}),
-        ((1,), {'b': 2}),
-        ((), {'a': 1, 'b': 2}),
-        ((), {'a': 1, 'b': 2, 'c': 3}),
-    ])
-    def test_preprocess_no_processors(self, args, kwargs):
+    def test_preprocess_no_processors(self):
 
         @preprocess()
         def func(a, b, c=3):
             return a, b, c
 
-        self.assertEqual(func(*args, **kwargs), (1, 2, 3))
+        for args, kwargs in ARGS_ABC:
+            with self.subTest(args=args, kwargs=kwargs):
+                self.assertEqual(func(*args, **kwargs), (1, 2, 3))
 
     def test_preprocess_bad_processor_name(self):
         a_processor = preprocess(a=int)
@@ -123,48 +146,17 @@ class PreprocessTestCase(TestCase):
                 pass
         self.assertEqual(e.exception.args[0], message)
 
-    @parameterized.expand([
-        ((1, 2), {}),
-        ((1, 2), {'c': 3}),
-        ((1,), {'b': 2}),
-        ((), {'a': 1, 'b': 2}),
-        ((), {'a': 1, 'b': 2, 'c': 3}),
-    ])
-    def test_preprocess_on_function(self, args, kwargs):
-
-        decorators = [
-            preprocess(a=call(str), b=call(float), c=call(lambda x: x + 1)),
-        ]
-
-        for decorator in decorators:
-            @decorator
-            def func(a, b, c=3):
-                return a, b, c
-            self.assertEqual(func(*args, **kwargs), ('1', 2.0, 4))
-
-    @parameterized.expand([
-        ((1, 2), {}),
-        ((1, 2), {'c': 3}),
-        ((1,), {'b': 2}),
-        ((), {'a': 1, 'b': 2}),
-        ((), {'a': 1, 'b': 2, 'c': 3}),
-    ])
-    def test_preprocess_on_method(self, args, kwargs):
-        decorators = [
-            preprocess(a=call(str), b=call(float), c=call(lambda x: x + 1)),
-        ]
-
-        for decorator in decorators:
-            class Foo(object):
-
-                @decorator
-                def method(self, a, b, c=3):
-                    return a, b, c
-
-                @classmethod
-                @decorator
-                def clsmeth(cls, a, b, c=3):
-                    return a, b, c
-
-            self.assertEqual(Foo.clsmeth(*args, **kwargs), ('1', 2.0, 4))
-            self.assertEqual(Foo().method(*args, **kwargs), ('1', 2.0, 4))
+    def test_preprocess_on_function(self):
+        for args, kwargs in ARGS_ABC:
+            with self.subTest(args=args, kwargs=kwargs):
+                self.assertEqual(_preproc_func(*args, **kwargs), ('1', 2.0, 4))
+
+    def test_preprocess_on_method(self):
+        for args, kwargs in ARGS_ABC:
+            with self.subTest(args=args, kwargs=kwargs):
+                self.assertEqual(
+                    _PreprocFoo.clsmeth(*args, **kwargs), ('1', 2.0, 4),
+                )
+                self.assertEqual(
+                    _PreprocFoo().method(*args, **kwargs), ('1', 2.0, 4),
+                )
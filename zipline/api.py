@@ -120,3 +120,17 @@ __all__ = [
     'sid',
     'ORDER_STATUS',
 ]
+
+
+def __getattr__(name):
+    # The API methods themselves are attached to this module by the
+    # ``api_method`` decorator when zipline.algorithm is imported, which no
+    # longer happens as a side effect of importing zipline.
+    import zipline.algorithm  # noqa: F401
+
+    try:
+        return globals()[name]
+    except KeyError:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
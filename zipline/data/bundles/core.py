@@ -1,12 +1,17 @@
 from collections import namedtuple
+from contextlib import ExitStack
+from datetime import datetime, timezone
 import errno
+from functools import cached_property
+import heapq
 import os
+from threading import Lock, RLock, local
 import warnings
+from weakref import WeakValueDictionary
 
-from contextlib2 import ExitStack
 import pandas as pd
 from zipline.utils.calendar_utils import get_calendar
-from toolz import curry, complement
+from toolz import curry
 
 from ..adjustments import SQLiteAdjustmentReader, SQLiteAdjustmentWriter
 from ..bcolz_daily_bars import BcolzDailyBarReader, BcolzDailyBarWriter
@@ -109,16 +114,77 @@ def from_bundle_ingest_dirname(cs):
     ts : pandas.Timestamp
         The time when this ingestion happened.
     """
-    return pd.Timestamp(cs.replace(';', ':'))
+    cs = cs.replace(';', ':')
+    # The stdlib parser is much cheaper than pandas' generic one, but it
+    # silently truncates anything finer than microseconds, so only use it
+    # for names no longer than 'YYYY-MM-DDTHH:MM:SS.ffffff'.
+    if len(cs) <= 26:
+        try:
+            return pd.Timestamp(datetime.fromisoformat(cs))
+        except ValueError:
+            pass
+    return pd.Timestamp(cs)
+
+
+def ingestions_for_bundle(bundle, environ=None, limit=None):
+    """Get the times of the ingestions for a bundle, newest first.
 
+    Parameters
+    ----------
+    bundle : str
+        The name of the bundle.
+    environ : mapping, optional
+        The environment variables.
+    limit : int, optional
+        The maximum number of ingestions to return. By default all of them
+        are returned.
 
-def ingestions_for_bundle(bundle, environ=None):
-    return sorted(
-        (from_bundle_ingest_dirname(ing)
-         for ing in os.listdir(pth.data_path([bundle], environ))
-         if not pth.hidden(ing)),
-        reverse=True,
+    Returns
+    -------
+    ingestions : list[pd.Timestamp]
+        The times of the ingestions.
+    """
+    names = (
+        ing
+        for ing in os.listdir(pth.data_path([bundle], environ))
+        if not pth.hidden(ing)
     )
+    # ingestion directory names sort lexicographically in chronological
+    # order, so we can order them before parsing and only parse the ones
+    # we return
+    if limit is None:
+        names = sorted(names, reverse=True)
+    else:
+        names = heapq.nlargest(limit, names)
+    return [from_bundle_ingest_dirname(ing) for ing in names]
+
+
+def _newest_ingestion_dirname(bundle_path):
+    """Get the name of the newest ingestion directory in ``bundle_path``.
+
+    Hidden entries, files, and directories whose names aren't ingestion
+    timestamps are skipped.
+
+    Returns
+    -------
+    name : str or None
+        The directory name, or None if there are no ingestions.
+    """
+    with os.scandir(bundle_path) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if not pth.hidden(entry.name) and entry.is_dir()
+        ]
+    # ingestion directory names sort lexicographically in chronological
+    # order, so only parse names until one is a valid ingestion
+    for name in sorted(names, reverse=True):
+        try:
+            from_bundle_ingest_dirname(name)
+        except ValueError:
+            continue
+        return name
+    return None
 
 
 RegisteredBundle = namedtuple(
@@ -131,11 +197,201 @@ RegisteredBundle = namedtuple(
      'create_writers']
 )
 
-BundleData = namedtuple(
-    'BundleData',
-    'asset_finder equity_minute_bar_reader equity_daily_bar_reader '
-    'adjustment_reader',
-)
+# Readers opened by ``BundleData``, keyed on the file they read and its
+# modification time so that repeated loads of the same ingestion share one
+# reader for as long as any of them holds on to it.
+_shared_readers = WeakValueDictionary()
+_shared_readers_lock = Lock()
+_thread_state = local()
+
+
+def _thread_key():
+    """Get an object identifying the current thread.
+
+    Unlike ``threading.get_ident()``, the key is never reused by a thread
+    started after this one exits, so it can't hand a new thread a reader
+    that belongs to a dead one.
+    """
+    try:
+        return _thread_state.key
+    except AttributeError:
+        key = _thread_state.key = object()
+        return key
+
+
+def _shared_reader(open_reader, path, *key):
+    """Get a reader for ``path``, reusing one that is already open.
+
+    Parameters
+    ----------
+    open_reader : callable[str -> reader]
+        The function used to open a new reader for ``path``.
+    path : str
+        The path to the file to read.
+    *key
+        Extra values that must also match for a reader to be reused.
+
+    Returns
+    -------
+    reader : any
+        The reader returned by ``open_reader``.
+    """
+    key = (open_reader, path, os.stat(path).st_mtime_ns) + key
+    with _shared_readers_lock:
+        reader = _shared_readers.get(key)
+        if reader is None:
+            reader = _shared_readers[key] = open_reader(path)
+    return reader
+
+
+def _open_adjustment_reader(path):
+    reader = SQLiteAdjustmentReader(path)
+    # Memory map the db and give it a larger page cache; these only apply to
+    # this connection and don't change the file on disk.
+    reader.conn.execute("PRAGMA mmap_size=268435456")
+    reader.conn.execute("PRAGMA cache_size=-65536")
+    return reader
+
+
+class BundleData(object):
+    """The raw data readers for an ingested bundle.
+
+    ``BundleData`` supports the interface of the namedtuple with fields
+    ``asset_finder``, ``equity_minute_bar_reader``, ``equity_daily_bar_reader``
+    and ``adjustment_reader`` that it used to be: it can be constructed from
+    the four readers, unpacked, indexed, compared, and used with ``_fields``,
+    ``_asdict`` and ``_replace``. It is not a ``tuple`` subclass.
+
+    ``load`` returns a ``BundleData`` whose readers are each opened the first
+    time they are accessed, so callers only pay for the backends they
+    actually use. Iterating, indexing or comparing one opens the readers
+    involved. The asset finder and adjustment reader are shared with other
+    bundles loaded from the same, unmodified ingestion. Readers are opened in
+    the thread that accesses them, and adjustment readers are only shared
+    within a thread because their sqlite connection can only be used from
+    the thread that created it.
+
+    Parameters
+    ----------
+    asset_finder : AssetFinder
+    equity_minute_bar_reader : BcolzMinuteBarReader
+    equity_daily_bar_reader : BcolzDailyBarReader
+    adjustment_reader : SQLiteAdjustmentReader
+    """
+    _fields = (
+        'asset_finder',
+        'equity_minute_bar_reader',
+        'equity_daily_bar_reader',
+        'adjustment_reader',
+    )
+
+    def __init__(self,
+                 asset_finder,
+                 equity_minute_bar_reader,
+                 equity_daily_bar_reader,
+                 adjustment_reader):
+        # instance attributes take precedence over the cached_property
+        # readers, so nothing is opened lazily
+        self.asset_finder = asset_finder
+        self.equity_minute_bar_reader = equity_minute_bar_reader
+        self.equity_daily_bar_reader = equity_daily_bar_reader
+        self.adjustment_reader = adjustment_reader
+
+    @classmethod
+    def _from_ingestion(cls,
+                        name,
+                        timestr,
+                        environ=None,
+                        daily_bar_reader_kwargs=None,
+                        minute_bar_reader_kwargs=None):
+        """Build a ``BundleData`` that opens the readers for an ingestion
+        as they are accessed.
+
+        Parameters
+        ----------
+        name : str
+            The name of the bundle.
+        timestr : str
+            The path to (or name of) the ingestion to read.
+        environ : mapping, optional
+            The environment variables.
+        daily_bar_reader_kwargs : dict, optional
+            Extra arguments to forward to the ``BcolzDailyBarReader``.
+        minute_bar_reader_kwargs : dict, optional
+            Extra arguments to forward to the ``BcolzMinuteBarReader``.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._timestr = timestr
+        self._environ = environ
+        self._daily_bar_reader_kwargs = daily_bar_reader_kwargs or {}
+        self._minute_bar_reader_kwargs = minute_bar_reader_kwargs or {}
+        return self
+
+    @cached_property
+    def asset_finder(self):
+        return _shared_reader(
+            AssetFinder,
+            asset_db_path(self._name, self._timestr, environ=self._environ),
+        )
+
+    @cached_property
+    def equity_minute_bar_reader(self):
+        return BcolzMinuteBarReader(
+            minute_equity_path(
+                self._name, self._timestr, environ=self._environ,
+            ),
+            **self._minute_bar_reader_kwargs
+        )
+
+    @cached_property
+    def equity_daily_bar_reader(self):
+        return BcolzDailyBarReader(
+            daily_equity_path(self._name, self._timestr, environ=self._environ),
+            **self._daily_bar_reader_kwargs
+        )
+
+    @cached_property
+    def adjustment_reader(self):
+        # sqlite connections can only be used from the thread that opened
+        # them, so only share adjustment readers within a thread
+        return _shared_reader(
+            _open_adjustment_reader,
+            adjustment_db_path(
+                self._name, self._timestr, environ=self._environ,
+            ),
+            _thread_key(),
+        )
+
+    def __iter__(self):
+        return (getattr(self, field) for field in self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(getattr(self, field) for field in self._fields[index])
+        return getattr(self, self._fields[index])
+
+    def __eq__(self, other):
+        if isinstance(other, (BundleData, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def _asdict(self):
+        return dict(zip(self._fields, self))
+
+    def _replace(self, **kwargs):
+        unexpected = set(kwargs) - set(self._fields)
+        if unexpected:
+            raise ValueError(
+                'Got unexpected field names: %r' % sorted(unexpected),
+            )
+        return type(self)(**dict(self._asdict(), **kwargs))
 
 BundleCore = namedtuple(
     'BundleCore',
@@ -176,6 +432,9 @@ def _make_bundle_core():
     # accidentally. Users may go through `register` to update this which will
     # warn when trampling another bundle.
     bundles = mappingproxy(_bundles)
+    # Guards updates to _bundles so that concurrent registrations of the same
+    # name can't both miss the overwrite warning.
+    _bundles_lock = RLock()
 
     @curry
     def register(name,
@@ -247,30 +506,31 @@ def _make_bundle_core():
         --------
         zipline.data.bundles.bundles
         """
-        if name in bundles:
-            warnings.warn(
-                'Overwriting bundle with name %r' % name,
-                stacklevel=3,
-            )
-
         if start_session and start_session.tz:
             start_session = start_session.tz_localize(None)
 
         if end_session and end_session.tz:
             end_session = end_session.tz_localize(None)
 
-        # NOTE: We don't eagerly compute calendar values here because
-        # `register` is called at module scope in zipline, and creating a
-        # calendar currently takes between 0.5 and 1 seconds, which causes a
-        # noticeable delay on the zipline CLI.
-        _bundles[name] = RegisteredBundle(
-            calendar_name=calendar_name,
-            start_session=start_session,
-            end_session=end_session,
-            minutes_per_day=minutes_per_day,
-            ingest=f,
-            create_writers=create_writers,
-        )
+        with _bundles_lock:
+            if name in bundles:
+                warnings.warn(
+                    'Overwriting bundle with name %r' % name,
+                    stacklevel=3,
+                )
+
+            # NOTE: We don't eagerly compute calendar values here because
+            # `register` is called at module scope in zipline, and creating a
+            # calendar currently takes between 0.5 and 1 seconds, which causes
+            # a noticeable delay on the zipline CLI.
+            _bundles[name] = RegisteredBundle(
+                calendar_name=calendar_name,
+                start_session=start_session,
+                end_session=end_session,
+                minutes_per_day=minutes_per_day,
+                ingest=f,
+                create_writers=create_writers,
+            )
         return f
 
     def unregister(name):
@@ -290,10 +550,11 @@ def _make_bundle_core():
         --------
         zipline.data.bundles.bundles
         """
-        try:
-            del _bundles[name]
-        except KeyError:
-            raise UnknownBundle(name)
+        with _bundles_lock:
+            try:
+                del _bundles[name]
+            except KeyError:
+                raise UnknownBundle(name)
 
     def ingest(name,
                environ=os.environ,
@@ -307,14 +568,16 @@ def _make_bundle_core():
         environ : mapping, optional
             The environment variables. By default this is os.environ.
         timestamp : datetime, optional
-            The timestamp to use for the load.
-            By default this is the current time.
+            The timestamp to use for the load. Naive timestamps are assumed
+            to be in UTC. By default this is the current time.
         """
         try:
             bundle = bundles[name]
         except KeyError:
             raise UnknownBundle(name)
 
+        # exchange_calendars caches the calendars it builds by name and
+        # arguments, so repeated ingests only pay the construction cost once.
         calendar = get_calendar(bundle.calendar_name)
 
         start_session = bundle.start_session
@@ -327,12 +590,16 @@ def _make_bundle_core():
             end_session = calendar.last_session
 
         if timestamp is None:
-            timestamp = pd.Timestamp.utcnow()
-        timestamp = timestamp.tz_convert('utc').tz_localize(None)
+            timestamp = pd.Timestamp(
+                datetime.now(timezone.utc).replace(tzinfo=None),
+            )
+        elif timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert('utc').tz_localize(None)
 
         timestr = to_bundle_ingest_dirname(timestamp)
         cachepath = cache_path(name, environ=environ)
-        pth.ensure_directory(pth.data_path([name, timestr], environ=environ))
+        ingest_path = pth.data_path([name, timestr], environ=environ)
+        pth.ensure_directory(ingest_path)
         pth.ensure_directory(cachepath)
         with dataframe_cache(cachepath, clean_on_failure=False) as cache, \
                 ExitStack() as stack:
@@ -374,6 +641,17 @@ def _make_bundle_core():
                         overwrite=True,
                     )
                 )
+                # The adjustments db is written from scratch here and discarded
+                # if the ingest fails, so there's no need to fsync every
+                # commit. Entering the connection commits anything still
+                # pending once the ingest function returns (or rolls it back
+                # if it raises) before the writer closes the connection.
+                adjustment_db_writer.conn.executescript(
+                    "PRAGMA synchronous=NORMAL;"
+                    "PRAGMA temp_store=MEMORY;"
+                    "PRAGMA cache_size=-65536;"
+                )
+                stack.enter_context(adjustment_db_writer.conn)
             else:
                 daily_bar_writer = None
                 minute_bar_writer = None
@@ -390,7 +668,7 @@ def _make_bundle_core():
                 start_session,
                 end_session,
                 cache,
-                pth.data_path([name, timestr], environ=environ),
+                ingest_path,
             )
 
     def most_recent_data(bundle_name, timestamp, environ=None):
@@ -409,21 +687,15 @@ def _make_bundle_core():
         if bundle_name not in bundles:
             raise UnknownBundle(bundle_name)
 
+        bundle_path = pth.data_path([bundle_name], environ=environ)
         try:
-            candidates = os.listdir(
-                pth.data_path([bundle_name], environ=environ),
-            )
-            return pth.data_path(
-                [bundle_name,
-                 max(
-                     filter(complement(pth.hidden), candidates),
-                     key=from_bundle_ingest_dirname,
-                 )],
-                environ=environ,
-            )
-        except (ValueError, OSError) as e:
-            if getattr(e, 'errno', errno.ENOENT) != errno.ENOENT:
+            newest = _newest_ingestion_dirname(bundle_path)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
                 raise
+            newest = None
+
+        if newest is None:
             raise ValueError(
                 'no data for bundle {bundle!r} on or before {timestamp}\n'
                 'maybe you need to run: $ quantrocket zipline ingest {bundle}'.format(
@@ -431,6 +703,7 @@ def _make_bundle_core():
                     timestamp=timestamp,
                 ),
             )
+        return os.path.join(bundle_path, newest)
 
     def load(name, environ=os.environ, timestamp=None,
             daily_bar_reader_kwargs={}, minute_bar_reader_kwargs={}):
@@ -454,21 +727,12 @@ def _make_bundle_core():
         if timestamp is None:
             timestamp = pd.Timestamp.utcnow()
         timestr = most_recent_data(name, timestamp, environ=environ)
-        return BundleData(
-            asset_finder=AssetFinder(
-                asset_db_path(name, timestr, environ=environ),
-            ),
-            equity_minute_bar_reader=BcolzMinuteBarReader(
-                minute_equity_path(name, timestr, environ=environ),
-                **minute_bar_reader_kwargs
-            ),
-            equity_daily_bar_reader=BcolzDailyBarReader(
-                daily_equity_path(name, timestr, environ=environ),
-                **daily_bar_reader_kwargs
-            ),
-            adjustment_reader=SQLiteAdjustmentReader(
-                adjustment_db_path(name, timestr, environ=environ),
-            ),
+        return BundleData._from_ingestion(
+            name,
+            timestr,
+            environ=environ,
+            daily_bar_reader_kwargs=daily_bar_reader_kwargs,
+            minute_bar_reader_kwargs=minute_bar_reader_kwargs,
         )
 
     return BundleCore(bundles, register, unregister, ingest, load)
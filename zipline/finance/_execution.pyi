@@ -0,0 +1,26 @@
+ZERO_ATOL = ...
+
+def round_to_tick(price, offset, prefer_round_down, tick_size):
+    """Round a price to a multiple of ``tick_size`` after shifting it by
+    ``offset``.
+
+    Parameters
+    ----------
+    price : float
+        The price to round.
+    offset : float
+        The rounding offset, as computed by
+        ``zipline.finance.execution._rounding_offset``.
+    prefer_round_down : bool
+        Whether to subtract ``offset`` from the price (rather than add it)
+        before rounding.
+    tick_size : float
+        The tick size to round the price to.
+
+    Returns
+    -------
+    rounded : float
+        The rounded price. Values within ``ZERO_ATOL`` of zero are snapped to
+        exactly zero.
+    """
+    ...
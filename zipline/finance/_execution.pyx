@@ -0,0 +1,52 @@
+from libc.math cimport ceil, floor, fmod
+
+# Rounded prices this close to zero are snapped to exactly zero. This matches
+# ``zp_math.tolerant_equals(rounded, 0.0)`` with its default tolerances.
+cdef double _zero_atol = 10e-7
+ZERO_ATOL = _zero_atol
+
+
+cpdef double round_to_tick(double price,
+                           double offset,
+                           bint prefer_round_down,
+                           double tick_size):
+    """Round a price to a multiple of ``tick_size`` after shifting it by
+    ``offset``.
+
+    Parameters
+    ----------
+    price : float
+        The price to round.
+    offset : float
+        The rounding offset, as computed by
+        ``zipline.finance.execution._rounding_offset``.
+    prefer_round_down : bool
+        Whether to subtract ``offset`` from the price (rather than add it)
+        before rounding.
+    tick_size : float
+        The tick size to round the price to.
+
+    Returns
+    -------
+    rounded : float
+        The rounded price. Values within ``ZERO_ATOL`` of zero are snapped to
+        exactly zero.
+    """
+    cdef double scaled, frac, rounded
+
+    scaled = (price - (offset if prefer_round_down else -offset)) / tick_size
+
+    # Python's float modulo always takes the sign of the divisor
+    frac = fmod(scaled, 1.0)
+    if frac < 0:
+        frac += 1.0
+
+    # round half away from zero like ``consistent_round``
+    if frac >= 0.5:
+        rounded = tick_size * ceil(scaled)
+    else:
+        rounded = tick_size * floor(scaled)
+
+    if -_zero_atol <= rounded <= _zero_atol:
+        return 0.0
+    return rounded
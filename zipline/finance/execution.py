@@ -60,14 +60,14 @@ Usage Guide:
 * Placing orders: https://qrok.it/dl/z/zipline-orders
 """
 import abc
+from functools import lru_cache
 from typing import Union
 from sys import float_info
-from six import with_metaclass
-from numpy import isfinite
+import numpy as np
 import zipline.utils.math_utils as zp_math
 from zipline.errors import BadOrderParameters
-from zipline.utils.compat import consistent_round
 from zipline.assets import Asset
+from zipline.finance._execution import ZERO_ATOL as _ZERO_ATOL, round_to_tick
 
 __all__ = [
     'ExecutionStyle',
@@ -81,10 +81,18 @@ __all__ = [
     'LimitOnCloseOrder',
 ]
 
-class ExecutionStyle(with_metaclass(abc.ABCMeta)):
+# Subtracted from the rounding offset to enforce the open-ness of the upper
+# bound on buys and the lower bound on sells.  Using the actual system epsilon
+# doesn't quite get there, so use a slightly less epsilon-ey value.
+_EPSILON = float_info.epsilon * 10
+
+
+class ExecutionStyle(abc.ABC):
     """Base class for order execution styles.
     """
 
+    __slots__ = ()
+
     _exchange = None
     _tif = None
 
@@ -94,7 +102,6 @@ class ExecutionStyle(with_metaclass(abc.ABCMeta)):
         Get the limit price for this order.
         Returns either None or a numerical value >= 0.
         """
-        raise NotImplementedError
 
     @abc.abstractmethod
     def get_stop_price(self, is_buy):
@@ -102,7 +109,6 @@ class ExecutionStyle(with_metaclass(abc.ABCMeta)):
         Get the stop price for this order.
         Returns either None or a numerical value >= 0.
         """
-        raise NotImplementedError
 
     @property
     def exchange(self):
@@ -143,6 +149,10 @@ class MarketOrder(ExecutionStyle):
         algo.order(asset, 100, style=style)
     """
 
+    # asset isn't used by market orders, but like the other styles it can be
+    # assigned so callers can tag any style with the asset being ordered
+    __slots__ = ('_exchange', 'order_params', 'asset')
+
     def __init__(
         self,
         exchange: str = None,
@@ -181,6 +191,15 @@ class LimitOrder(ExecutionStyle):
 
         algo.order(asset, 100, style=LimitOrder(10.0))
     """
+
+    __slots__ = (
+        '_limit_price',
+        '_asset',
+        '_exchange',
+        'order_params',
+        '_limit_prices',
+    )
+
     def __init__(
         self,
         limit_price: float,
@@ -190,18 +209,39 @@ class LimitOrder(ExecutionStyle):
         ):
         check_stoplimit_prices(limit_price, 'limit')
 
+        self._asset = asset
         self.limit_price = limit_price
         self._exchange = exchange
         self.order_params = order_params
-        self.asset = asset
 
-    def get_limit_price(self, is_buy):
-        return asymmetric_round_price(
-            self.limit_price,
-            is_buy,
-            tick_size=(0.01 if self.asset is None else self.asset.tick_size)
+    @property
+    def asset(self):
+        return self._asset
+
+    @asset.setter
+    def asset(self, asset):
+        # the rounded prices depend on the asset's tick size
+        self._asset = asset
+        self.limit_price = self._limit_price
+
+    @property
+    def limit_price(self):
+        return self._limit_price
+
+    @limit_price.setter
+    def limit_price(self, limit_price):
+        self._limit_price = limit_price
+        # lru_cache needs a hashable price, so 0-d arrays are converted
+        # here. This also shares one cache entry between 10, 10.0 and
+        # np.float64(10).
+        self._limit_prices = _round_both_ways(
+            float(limit_price),
+            _tick_size(self._asset),
         )
 
+    def get_limit_price(self, is_buy):
+        return self._limit_prices[1 if is_buy else 0]
+
     def get_stop_price(self, _is_buy):
         return None
 
@@ -224,6 +264,15 @@ class StopOrder(ExecutionStyle):
         Additional broker-specific order parameters to use in live trading.
         Ignored in backtests.
     """
+
+    __slots__ = (
+        '_stop_price',
+        '_asset',
+        '_exchange',
+        'order_params',
+        '_stop_prices',
+    )
+
     def __init__(
         self,
         stop_price: float,
@@ -233,20 +282,41 @@ class StopOrder(ExecutionStyle):
         ):
         check_stoplimit_prices(stop_price, 'stop')
 
+        self._asset = asset
         self.stop_price = stop_price
         self._exchange = exchange
         self.order_params = order_params
-        self.asset = asset
+
+    @property
+    def asset(self):
+        return self._asset
+
+    @asset.setter
+    def asset(self, asset):
+        # the rounded prices depend on the asset's tick size
+        self._asset = asset
+        self.stop_price = self._stop_price
+
+    @property
+    def stop_price(self):
+        return self._stop_price
+
+    @stop_price.setter
+    def stop_price(self, stop_price):
+        self._stop_price = stop_price
+        # lru_cache needs a hashable price, so 0-d arrays are converted
+        # here. This also shares one cache entry between 10, 10.0 and
+        # np.float64(10).
+        self._stop_prices = _round_both_ways(
+            float(stop_price),
+            _tick_size(self._asset),
+        )
 
     def get_limit_price(self, _is_buy):
         return None
 
     def get_stop_price(self, is_buy):
-        return asymmetric_round_price(
-            self.stop_price,
-            not is_buy,
-            tick_size=(0.01 if self.asset is None else self.asset.tick_size)
-        )
+        return self._stop_prices[0 if is_buy else 1]
 
 
 class StopLimitOrder(ExecutionStyle):
@@ -270,6 +340,17 @@ class StopLimitOrder(ExecutionStyle):
         Additional broker-specific order parameters to use in live trading.
         Ignored in backtests.
     """
+
+    __slots__ = (
+        '_limit_price',
+        '_stop_price',
+        '_asset',
+        '_exchange',
+        'order_params',
+        '_limit_prices',
+        '_stop_prices',
+    )
+
     def __init__(
         self,
         limit_price: float,
@@ -281,26 +362,59 @@ class StopLimitOrder(ExecutionStyle):
         check_stoplimit_prices(limit_price, 'limit')
         check_stoplimit_prices(stop_price, 'stop')
 
+        self._asset = asset
         self.limit_price = limit_price
         self.stop_price = stop_price
         self._exchange = exchange
         self.order_params = order_params
-        self.asset = asset
 
-    def get_limit_price(self, is_buy):
-        return asymmetric_round_price(
-            self.limit_price,
-            is_buy,
-            tick_size=(0.01 if self.asset is None else self.asset.tick_size)
+    @property
+    def asset(self):
+        return self._asset
+
+    @asset.setter
+    def asset(self, asset):
+        # the rounded prices depend on the asset's tick size
+        self._asset = asset
+        self.limit_price = self._limit_price
+        self.stop_price = self._stop_price
+
+    @property
+    def limit_price(self):
+        return self._limit_price
+
+    @limit_price.setter
+    def limit_price(self, limit_price):
+        self._limit_price = limit_price
+        # lru_cache needs a hashable price, so 0-d arrays are converted
+        # here. This also shares one cache entry between 10, 10.0 and
+        # np.float64(10).
+        self._limit_prices = _round_both_ways(
+            float(limit_price),
+            _tick_size(self._asset),
         )
 
-    def get_stop_price(self, is_buy):
-        return asymmetric_round_price(
-            self.stop_price,
-            not is_buy,
-            tick_size=(0.01 if self.asset is None else self.asset.tick_size)
+    @property
+    def stop_price(self):
+        return self._stop_price
+
+    @stop_price.setter
+    def stop_price(self, stop_price):
+        self._stop_price = stop_price
+        # lru_cache needs a hashable price, so 0-d arrays are converted
+        # here. This also shares one cache entry between 10, 10.0 and
+        # np.float64(10).
+        self._stop_prices = _round_both_ways(
+            float(stop_price),
+            _tick_size(self._asset),
         )
 
+    def get_limit_price(self, is_buy):
+        return self._limit_prices[1 if is_buy else 0]
+
+    def get_stop_price(self, is_buy):
+        return self._stop_prices[0 if is_buy else 1]
+
 class MarketOnOpenOrder(MarketOrder):
     """
     Execution style for orders to be filled at the open price of the asset's
@@ -323,6 +437,7 @@ class MarketOnOpenOrder(MarketOrder):
         algo.order(asset, 100, style=MarketOnOpenOrder())
     """
 
+    __slots__ = ()
     _tif = "OPG"
 
 class LimitOnOpenOrder(LimitOrder):
@@ -352,6 +467,7 @@ class LimitOnOpenOrder(LimitOrder):
         algo.order(asset, 100, style=LimitOnOpenOrder(10.0))
     """
 
+    __slots__ = ()
     _tif = "OPG"
 
 class MarketOnCloseOrder(MarketOrder):
@@ -376,6 +492,7 @@ class MarketOnCloseOrder(MarketOrder):
         algo.order(asset, 100, style=MarketOnCloseOrder())
     """
 
+    __slots__ = ()
     _tif = "CLS"
 
 class LimitOnCloseOrder(LimitOrder):
@@ -405,6 +522,7 @@ class LimitOnCloseOrder(LimitOrder):
         algo.order(asset, 100, style=LimitOnCloseOrder(10.0))
     """
 
+    __slots__ = ()
     _tif = "CLS"
 
 def asymmetric_round_price(price, prefer_round_down, tick_size, diff=0.95):
@@ -423,38 +541,101 @@ def asymmetric_round_price(price, prefer_round_down, tick_size, diff=0.95):
     If prefer_round_down: [<X-1>.0095, X.0195) -> round to X.01.
     If not prefer_round_down: (<X-1>.0005, X.0105] -> round to X.01.
     """
-    precision = zp_math.number_of_decimal_places(tick_size)
-    multiplier = int(tick_size * (10 ** precision))
-    diff -= 0.5  # shift the difference down
-    diff *= (10 ** -precision)  # adjust diff to precision of tick size
-    diff *= multiplier  # adjust diff to value of tick_size
-
-    # Subtracting an epsilon from diff to enforce the open-ness of the upper
-    # bound on buys and the lower bound on sells.  Using the actual system
-    # epsilon doesn't quite get there, so use a slightly less epsilon-ey value.
-    epsilon = float_info.epsilon * 10
-    diff = diff - epsilon
-
-    # relies on rounding half away from zero, unlike numpy's bankers' rounding
-    rounded = tick_size * consistent_round(
-        (price - (diff if prefer_round_down else -diff)) / tick_size
+    return round_to_tick(
+        price,
+        _rounding_offset(tick_size, diff),
+        prefer_round_down,
+        tick_size,
+    )
+
+
+def asymmetric_round_prices(prices, prefer_round_down, tick_size, diff=0.95):
+    """
+    Vectorized version of ``asymmetric_round_price`` for an array of prices.
+
+    Parameters
+    ----------
+    prices : np.ndarray[float64]
+        The prices to round.
+    prefer_round_down : bool
+        Whether to prefer rounding down.
+    tick_size : float
+        The tick size to round the prices to.
+    diff : float, optional
+        The rounding threshold. See ``asymmetric_round_price``.
+
+    Returns
+    -------
+    rounded : np.ndarray[float64]
+        The rounded prices. Each entry is equal to calling
+        ``asymmetric_round_price`` on the corresponding price.
+    """
+    diff = _rounding_offset(tick_size, diff)
+    scaled = (
+        np.asarray(prices, dtype='f8') - (diff if prefer_round_down else -diff)
+    ) / tick_size
+    # round half away from zero like ``consistent_round``
+    rounded = tick_size * np.where(
+        np.mod(scaled, 1) >= 0.5,
+        np.ceil(scaled),
+        np.floor(scaled),
     )
-    if zp_math.tolerant_equals(rounded, 0.0):
-        return 0.0
+    rounded[np.abs(rounded) <= _ZERO_ATOL] = 0.0
     return rounded
 
 
+def _tick_size(asset):
+    """
+    Get the tick size to round an order's prices to.
+    """
+    return 0.01 if asset is None else asset.tick_size
+
+
+@lru_cache(maxsize=4096)
+def _round_both_ways(price, tick_size, diff=0.95):
+    """
+    Round a price both ways with ``asymmetric_round_price``.
+
+    Algorithms tend to place many orders at the same prices, so the results
+    are cached.
+
+    Returns
+    -------
+    rounded : tuple[float, float]
+        The price rounded preferring to round up, and the price rounded
+        preferring to round down. This can be indexed by
+        ``prefer_round_down``.
+    """
+    return (
+        asymmetric_round_price(price, False, tick_size, diff),
+        asymmetric_round_price(price, True, tick_size, diff),
+    )
+
+
+@lru_cache(maxsize=128)
+def _rounding_offset(tick_size, diff):
+    """
+    Compute the offset ``asymmetric_round_price`` shifts prices by before
+    rounding them to ``tick_size``.
+
+    This only depends on the tick size and ``diff``, which are the same for
+    every order in an asset, so it is cached.
+    """
+    precision = zp_math.number_of_decimal_places(tick_size)
+    multiplier = int(tick_size * (10 ** precision))
+    # shift the difference down, adjust it to the precision of the tick size,
+    # and then to the value of the tick size
+    return (diff - 0.5) * (10 ** -precision) * multiplier - _EPSILON
+
+
 def check_stoplimit_prices(price, label):
     """
     Check to make sure the stop/limit prices are reasonable and raise
     a BadOrderParameters exception if not.
     """
     try:
-        if not isfinite(price):
-            raise BadOrderParameters(
-                msg="Attempted to place an order with a {} price "
-                    "of {}.".format(label, price)
-            )
+        # NaN != NaN, and inf - inf is NaN, so this is False for both
+        is_finite = price == price and price - price == 0.0
     # This catches arbitrary objects
     except TypeError:
         raise BadOrderParameters(
@@ -462,6 +643,12 @@ def check_stoplimit_prices(price, label):
                 "of {}.".format(label, type(price))
         )
 
+    if not is_finite:
+        raise BadOrderParameters(
+            msg="Attempted to place an order with a {} price "
+                "of {}.".format(label, price)
+        )
+
     if price < 0:
         raise BadOrderParameters(
             msg="Can't place a {} order with a negative price.".format(label)
@@ -1,4 +1,3 @@
-
 NANOS_IN_MINUTE = ...
 
 BAR = ...
@@ -7,4 +6,5 @@ SESSION_END = ...
 MINUTE_END = ...
 BEFORE_TRADING_START_BAR = ...
 
-class MinuteSimulationClock: ...
\ No newline at end of file
+class MinuteSimulationClock:
+    def as_arrays(self): ...
@@ -88,48 +88,116 @@ cdef class MinuteSimulationClock:
 
         return minutes_by_session
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef tuple _session_events(self, int idx, np.int64_t session_nano):
+        """
+        Build the (nanos, codes) arrays of every event emitted for a single
+        session.
+        """
+        cdef np.int64_t bts_nano, last_minute
+        cdef Py_ssize_t bts_idx
+        cdef np.ndarray[np.int64_t, ndim=1] minutes_nanos, times
+        cdef np.ndarray[np.int8_t, ndim=1] codes
+        cdef Py_ssize_t per_minute = 2 if self.minute_emission else 1
+        cdef Py_ssize_t n_bars, n_events
+
+        minutes_nanos = self.minutes_by_session[session_nano].asi8
+        if len(minutes_nanos) == 0:
+            # bounds checking is off below, so don't index an empty session
+            raise IndexError(
+                "session {} has no minutes".format(
+                    pd.Timestamp(session_nano, tz='UTC'),
+                )
+            )
+        n_bars = len(minutes_nanos) * per_minute
+        last_minute = minutes_nanos[len(minutes_nanos) - 1]
+        bts_nano = self.bts_nanos[idx]
+
+        if bts_nano > last_minute:
+            # before_trading_start is after the last close,
+            # so don't emit it
+            bts_idx = -1
+            n_events = n_bars + 2
+        else:
+            # we have to search anew every session, because there is no
+            # guarantee that any two session start on the same minute
+            bts_idx = minutes_nanos.searchsorted(bts_nano) * per_minute
+            n_events = n_bars + 3
+
+        times = np.empty(n_events, dtype=np.int64)
+        codes = np.empty(n_events, dtype=np.int8)
+
+        times[0] = session_nano
+        codes[0] = SESSION_START
+
+        bar_nanos = np.repeat(minutes_nanos, per_minute)
+        if self.minute_emission:
+            bar_codes = np.tile(
+                np.array([BAR, MINUTE_END], dtype=np.int8),
+                len(minutes_nanos),
+            )
+        else:
+            bar_codes = np.full(n_bars, BAR, dtype=np.int8)
+
+        if bts_idx < 0:
+            times[1:n_bars + 1] = bar_nanos
+            codes[1:n_bars + 1] = bar_codes
+        else:
+            # all the minutes before bts_minute, then bts_minute itself,
+            # then all the minutes after it
+            times[1:bts_idx + 1] = bar_nanos[:bts_idx]
+            codes[1:bts_idx + 1] = bar_codes[:bts_idx]
+            times[bts_idx + 1] = bts_nano
+            codes[bts_idx + 1] = BEFORE_TRADING_START_BAR
+            times[bts_idx + 2:n_bars + 2] = bar_nanos[bts_idx:]
+            codes[bts_idx + 2:n_bars + 2] = bar_codes[bts_idx:]
+
+        times[n_events - 1] = last_minute
+        codes[n_events - 1] = SESSION_END
+
+        return times, codes
+
     def __iter__(self):
-        minute_emission = self.minute_emission
+        for idx, session_nano in enumerate(self.sessions_nanos):
+            times, codes = self._session_events(idx, session_nano)
+            yield from zip(pd.to_datetime(times, utc=True), codes.tolist())
+
+    def as_arrays(self):
+        """
+        Return every event the clock would emit as two parallel arrays.
+
+        Returns
+        -------
+        times : np.ndarray[datetime64[ns]]
+            The (UTC) time of each event.
+        events : np.ndarray[int8]
+            The event code for each entry in ``times``.
+
+        Notes
+        -----
+        This produces the same sequence as iterating the clock, without
+        allocating a Timestamp and a tuple per event.
+        """
+        cdef int idx
+        cdef np.int64_t session_nano
 
+        times = []
+        events = []
         for idx, session_nano in enumerate(self.sessions_nanos):
-            yield pd.Timestamp(session_nano, tz='UTC'), SESSION_START
-
-            bts_minute = pd.Timestamp(self.bts_nanos[idx], tz='UTC')
-            regular_minutes = self.minutes_by_session[session_nano]
-
-            if bts_minute > regular_minutes[-1]:
-                # before_trading_start is after the last close,
-                # so don't emit it
-                for minute, evt in self._get_minutes_for_list(
-                    regular_minutes,
-                    minute_emission
-                ):
-                    yield minute, evt
-            else:
-                # we have to search anew every session, because there is no
-                # guarantee that any two session start on the same minute
-                bts_idx = regular_minutes.searchsorted(bts_minute)
-
-                # emit all the minutes before bts_minute
-                for minute, evt in self._get_minutes_for_list(
-                    regular_minutes[0:bts_idx],
-                    minute_emission
-                ):
-                    yield minute, evt
-
-                yield bts_minute, BEFORE_TRADING_START_BAR
-
-                # emit all the minutes after bts_minute
-                for minute, evt in self._get_minutes_for_list(
-                    regular_minutes[bts_idx:],
-                    minute_emission
-                ):
-                    yield minute, evt
-
-            yield regular_minutes[-1], SESSION_END
-
-    def _get_minutes_for_list(self, minutes, minute_emission):
-        for minute in minutes:
-            yield minute, BAR
-            if minute_emission:
-                yield minute, MINUTE_END
+            session_times, session_events = self._session_events(
+                idx, session_nano,
+            )
+            times.append(session_times)
+            events.append(session_events)
+
+        if not times:
+            return (
+                np.array([], dtype='datetime64[ns]'),
+                np.array([], dtype=np.int8),
+            )
+
+        return (
+            np.concatenate(times).view('datetime64[ns]'),
+            np.concatenate(events),
+        )
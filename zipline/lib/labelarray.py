@@ -627,7 +627,12 @@ class LabelArray(ndarray):
             f_to_use = f
 
         # Call f on each unique value in our categories.
-        results = np.vectorize(f_to_use, otypes=[bool_dtype])(self.categories)
+        categories = self.categories
+        results = np.fromiter(
+            map(f_to_use, categories),
+            dtype=bool_dtype,
+            count=len(categories),
+        )
 
         # missing_value should produce False no matter what
         results[self.reverse_categories[self.missing_value]] = False
@@ -679,9 +684,14 @@ class LabelArray(ndarray):
 
             return ret
 
-        new_categories_with_duplicates = (
-            np.vectorize(f_to_use, otypes=[object])(self.categories)
+        # Call f exactly once per category. Filling a preallocated object
+        # array keeps numpy from trying to interpret the returned strings.
+        categories = self.categories
+        new_categories_with_duplicates = np.empty(
+            len(categories),
+            dtype=object,
         )
+        new_categories_with_duplicates[:] = list(map(f_to_use, categories))
 
         # If f() maps multiple inputs to the same output, then we can end up
         # with the same code duplicated multiple times. Compress the categories
@@ -1,8 +1,12 @@
 """
 Algorithms for computing quantiles on numpy arrays.
 """
+import numpy as np
 from numpy.lib import apply_along_axis
-from pandas import qcut
+from pandas import qcut, unique
+from pandas.api.types import is_integer
+
+from zipline.utils.numpy_utils import float64_dtype, int64_dtype
 
 
 def quantiles(data, nbins_or_partition_bounds):
@@ -17,3 +21,67 @@ def quantiles(data, nbins_or_partition_bounds):
         labels=False,
         duplicates="drop",
     )
+
+
+def quantile_labels(data, mask, nbins_or_partition_bounds, missing_value):
+    """
+    Compute rowwise integer quantile labels on the masked-in entries of an
+    input.
+
+    This is equivalent to::
+
+        result = quantiles(np.where(mask, data, np.nan), bins)
+        result[np.isnan(result)] = missing_value
+        result.astype(int64)
+
+    but it bins each row directly into the output buffer, without
+    materializing the intermediate float arrays or going through
+    ``pandas.qcut``.
+
+    Parameters
+    ----------
+    data : np.ndarray[ndim=2]
+        The values to bin.
+    mask : np.ndarray[bool, ndim=2]
+        Locations in ``data`` to bin. Masked-out and NaN locations are labeled
+        with ``missing_value``.
+    nbins_or_partition_bounds : int or array-like[float]
+        The number of quantiles, or the quantile bounds, as accepted by
+        ``pandas.qcut``.
+    missing_value : int
+        The label to write for entries that don't fall in any bin.
+
+    Returns
+    -------
+    labels : np.ndarray[int64, ndim=2]
+        The quantile each entry of ``data`` falls in.
+    """
+    if is_integer(nbins_or_partition_bounds):
+        bounds = np.linspace(0, 1, nbins_or_partition_bounds + 1)
+    else:
+        bounds = nbins_or_partition_bounds
+
+    data = data.astype(float64_dtype, copy=False)
+    valid = mask & ~np.isnan(data)
+    out = np.full(data.shape, missing_value, dtype=int64_dtype)
+
+    for row, row_valid, out_row in zip(data, valid, out):
+        values = row[row_valid]
+
+        # This mirrors pandas.qcut(..., labels=False, duplicates='drop'),
+        # which treats the first bin as closed on the left.
+        bins = np.quantile(values, bounds)
+        unique_bins = unique(bins)
+        if len(unique_bins) < len(bins) and len(bins) != 2:
+            bins = unique_bins
+
+        ids = bins.searchsorted(values, side='left')
+        ids[values == bins[0]] = 1
+
+        out_row[row_valid] = np.where(
+            (ids == 0) | (ids == len(bins)),
+            missing_value,
+            ids - 1,
+        )
+
+    return out
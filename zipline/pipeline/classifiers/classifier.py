@@ -6,17 +6,16 @@ if TYPE_CHECKING:
     from zipline.pipeline.factors import Factor
 from pydantic import validate_call
 
-from functools import partial
 from numbers import Number
 import operator
 import re
 
-from numpy import where, isnan, nan, zeros
+from numpy import iinfo
 import pandas as pd
 
 from zipline.errors import UnsupportedDataType
 from zipline.lib.labelarray import LabelArray
-from zipline.lib.quantiles import quantiles
+from zipline.lib.quantiles import quantile_labels
 from zipline.pipeline.api_utils import restrict_to_dtype
 from zipline.pipeline.dtypes import (
     CLASSIFIER_DTYPES,
@@ -28,6 +27,8 @@ from zipline.utils.compat import unicode
 from zipline.utils.numpy_utils import (
     categorical_dtype,
     int64_dtype,
+    is_element_lookup_table,
+    is_element_searchsorted,
     vectorized_is_element,
 )
 
@@ -42,6 +43,24 @@ from ..mixins import (
 )
 
 
+# Integer isin() calls with at most this many choices are computed as a
+# numexpr disjunction of equality checks.
+_ISIN_NUMEXPR_MAX_CHOICES = 4
+
+# Larger sets of integer isin() choices spanning fewer values than this are
+# checked with a boolean lookup table, and sparser ones with a binary search,
+# rather than a set lookup per element.
+_ISIN_LOOKUP_TABLE_MAX_RANGE = 1 << 20
+_INT64_INFO = iinfo(int64_dtype)
+
+
+def _fits_int64(choices):
+    """
+    Whether a non-empty set of int choices is representable as int64.
+    """
+    return _INT64_INFO.min <= min(choices) and max(choices) <= _INT64_INFO.max
+
+
 string_classifiers_only = restrict_to_dtype(
     dtype=categorical_dtype,
     message_template=(
@@ -125,13 +144,18 @@ class Classifier(RestrictedDTypeMixin, ComputableTerm):
             # Numexpr doesn't know how to use LabelArrays.
             return ArrayPredicate(term=self, op=operator.ne, opargs=(other,))
 
-    def bad_compare(opname, other):
-        raise TypeError('cannot compare classifiers with %s' % opname)
+    def bad_compare(opname):
+        """
+        Make an ordered comparison method that always raises a TypeError.
+        """
+        def method(self, other):
+            raise TypeError('cannot compare classifiers with %s' % opname)
+        return method
 
-    __gt__ = partial(bad_compare, '>')
-    __ge__ = partial(bad_compare, '>=')
-    __le__ = partial(bad_compare, '<=')
-    __lt__ = partial(bad_compare, '<')
+    __gt__ = bad_compare('>')
+    __ge__ = bad_compare('>=')
+    __le__ = bad_compare('<=')
+    __lt__ = bad_compare('<')
 
     del bad_compare
 
@@ -306,9 +330,24 @@ class Classifier(RestrictedDTypeMixin, ComputableTerm):
 
         if self.dtype == int64_dtype:
             if only_contains(int, choices):
+                if not choices or not _fits_int64(choices):
+                    op = vectorized_is_element
+                elif len(choices) <= _ISIN_NUMEXPR_MAX_CHOICES:
+                    return NumExprFilter.create(
+                        " | ".join(
+                            "(x_0 == {})".format(int(choice))
+                            for choice in sorted(choices)
+                        ),
+                        binds=(self,),
+                    )
+                elif (max(choices) - min(choices)
+                      < _ISIN_LOOKUP_TABLE_MAX_RANGE):
+                    op = is_element_lookup_table
+                else:
+                    op = is_element_searchsorted
                 return ArrayPredicate(
                     term=self,
-                    op=vectorized_is_element,
+                    op=op,
                     opargs=(choices,),
                 )
             else:
@@ -359,13 +398,12 @@ class Classifier(RestrictedDTypeMixin, ComputableTerm):
         assert isinstance(result.values, pd.Categorical), (
             'Expected a Categorical, got %r.' % type(result.values)
         )
-        with_missing = pd.Series(
-            data=pd.Categorical(
-                result.values,
-                result.values.categories.union([self.missing_value]),
-            ),
-            index=result.index,
-        )
+        if self.missing_value in result.values.categories:
+            # The missing value can already be filled in without recoding.
+            with_missing = result
+        else:
+            # Appending the category leaves the existing codes as they are.
+            with_missing = result.cat.add_categories([self.missing_value])
         return LabelArray(
             super(Classifier, self).to_workspace_value(
                 with_missing,
@@ -603,11 +641,9 @@ class Everything(Classifier):
     missing_value = -1
 
     def _compute(self, arrays, dates, assets, mask):
-        return where(
-            mask,
-            zeros(shape=mask.shape, dtype=int64_dtype),
-            self.missing_value,
-        )
+        # True -> 0 and False -> -1 (our missing_value), without allocating a
+        # separate array of zeros to select from.
+        return mask.astype(int64_dtype) - 1
 
 
 class Quantiles(SingleInputMixin, Classifier):
@@ -620,14 +656,14 @@ class Quantiles(SingleInputMixin, Classifier):
     missing_value = -1
 
     def _compute(self, arrays, dates, assets, mask):
-        data = arrays[0]
-        bins = self.params['bins']
-        to_bin = where(mask, data, nan)
-        result = quantiles(to_bin, bins)
-        # Write self.missing_value into nan locations, whether they were
-        # generated by our input mask or not.
-        result[isnan(result)] = self.missing_value
-        return result.astype(int64_dtype)
+        # Entries that are masked out or nan in the input are both labeled
+        # with self.missing_value.
+        return quantile_labels(
+            arrays[0],
+            mask,
+            self.params['bins'],
+            self.missing_value,
+        )
 
     def graph_repr(self):
         """Short repr to use when rendering Pipeline graphs."""
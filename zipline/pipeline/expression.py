@@ -1,6 +1,7 @@
 """
 NumericalExpression term.
 """
+from functools import lru_cache
 import re
 from itertools import chain
 from numbers import Number
@@ -16,6 +17,19 @@ from zipline.utils.numpy_utils import bool_dtype
 
 _VARIABLE_NAME_RE = re.compile("^(x_)([0-9]+)$")
 
+
+@lru_cache(maxsize=512)
+def _expr_variable_names(expr):
+    """
+    Get the names of the variables referenced by a numexpr expression.
+
+    Parsing the expression dominates the cost of constructing small
+    expressions, and the same expression strings tend to be built over and
+    over again, so cache the result on the expression text.
+    """
+    variable_names, _unused = getExprNames(expr, {})
+    return tuple(variable_names)
+
 # Map from op symbol to equivalent Python magic method name.
 ops_to_methods = {
     '+': '__add__',
@@ -217,9 +231,8 @@ class NumericalExpression(ComputableTerm):
         Ensure that our expression string has variables of the form x_0, x_1,
         ... x_(N - 1), where N is the length of our inputs.
         """
-        variable_names, _unused = getExprNames(self._expr, {})
         expr_indices = []
-        for name in variable_names:
+        for name in _expr_variable_names(self._expr):
             if name == 'inf':
                 continue
             match = _VARIABLE_NAME_RE.match(name)
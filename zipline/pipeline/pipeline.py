@@ -1,5 +1,8 @@
-import six
+import ast
+from copy import deepcopy
+from functools import lru_cache
 from typing import Literal
+from weakref import WeakKeyDictionary
 
 import pandas as pd
 from pydantic import validate_call
@@ -21,9 +24,68 @@ from .filters import (
     NotNullFilter
 )
 from .classifiers import Latest as LatestClassifier
+from .data.master import SecuritiesMaster
 from .factors import Latest as LatestFactor
 from .term import AssetExists, ComputableTerm, Term
 
+@lru_cache(maxsize=512)
+def _and_conjuncts(expr):
+    """
+    Parses a NumExprFilter expression into the variables it ANDs together.
+
+    Returns a tuple of (name, negated) pairs, or None if the expression is
+    anything other than an AND of variables and inverted variables.
+    """
+    try:
+        node = ast.parse(expr, mode="eval").body
+    except SyntaxError:
+        return None
+
+    conjuncts = []
+    nodes = [node]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd):
+            nodes.extend((node.right, node.left))
+            continue
+
+        negated = isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Invert)
+        if negated:
+            node = node.operand
+        if not isinstance(node, ast.Name):
+            return None
+        conjuncts.append((node.id, negated))
+
+    return tuple(conjuncts)
+
+# prescreens already converted from initial_universe Filters
+_prescreen_cache = WeakKeyDictionary()
+
+# maps the name of an ArrayPredicate op to the prescreen op, whether the
+# prescreen op is negated, and a function converting the op's first argument
+# to prescreen values
+_PRESCREEN_OPS = {
+    "eq": ("eq", False, lambda value: [value]),
+    "isin": ("eq", False, list),
+    "ne": ("eq", True, lambda value: [value]),
+    "has_substring": ("contains", False, lambda value: value),
+    "startswith": ("startswith", False, lambda value: value),
+    "endswith": ("endswith", False, lambda value: value),
+    "matches": ("match", False, lambda value: value),
+}
+
+def _securities_master_column(term):
+    """
+    Returns the SecuritiesMaster column that is the sole input to a term,
+    or None.
+    """
+    if len(term.inputs) != 1:
+        return None
+    column = term.inputs[0]
+    if getattr(column, "dataset", None) is SecuritiesMaster:
+        return column
+    return None
+
 def _term_to_prescreen_fielddef(term):
     """
     Tries to convert a term to a prescreen field definition,
@@ -39,89 +101,45 @@ def _term_to_prescreen_fielddef(term):
     """
     # check if the term is an ArrayPredicate of a SecuritiesMaster column,
     # e.g. SecuritiesMaster.SecType.latest.eq('STK')
-    if (isinstance(term, ArrayPredicate)
-        and len(term.inputs) == 1
-        and isinstance(term.inputs[0], LatestClassifier)
-        and len(term.inputs[0].inputs) == 1
-        and hasattr(term.inputs[0].inputs[0], "dataset")
-        and term.inputs[0].inputs[0].dataset.qualname == "SecuritiesMaster"
-        and term.params['op'].__name__ in (
-            "eq",
-            "isin",
-            "ne",
-            "has_substring",
-            "startswith",
-            "endswith",
-            "matches",
-            )):
-        field = term.inputs[0].inputs[0].name
-        if term.params['op'].__name__ == "eq":
-            op = "eq"
-            negate = False
-            values = [term.params['opargs'][0]]
-        elif term.params['op'].__name__ == "isin":
-            op = "eq"
-            negate = False
-            values = list(term.params['opargs'][0])
-        elif term.params['op'].__name__ == "ne":
-            op = "eq"
-            negate = True
-            values = [term.params['opargs'][0]]
-        elif term.params['op'].__name__ == "has_substring":
-            op = "contains"
-            negate = False
-            values = term.params['opargs'][0]
-        elif term.params['op'].__name__ == "startswith":
-            op = "startswith"
-            negate = False
-            values = term.params['opargs'][0]
-        elif term.params['op'].__name__ == "endswith":
-            op = "endswith"
-            negate = False
-            values = term.params['opargs'][0]
-        elif term.params['op'].__name__ == "matches":
-            op = "match"
-            negate = False
-            values = term.params['opargs'][0]
-
-        return {"field": field, "op": op, "negate": negate, "values": values}
+    if isinstance(term, ArrayPredicate):
+        opdef = _PRESCREEN_OPS.get(term.params['op'].__name__)
+        if opdef is None or not isinstance(term.inputs[0], LatestClassifier):
+            return None
+        column = _securities_master_column(term.inputs[0])
+        if column is None:
+            return None
+        op, negate, to_values = opdef
+        values = to_values(term.params['opargs'][0])
+        return {"field": column.name, "op": op, "negate": negate, "values": values}
 
     # check if the term is a boolean SecuritiesMaster column, e.g.
     # SecuritiesMaster.Etf.latest
-    if (isinstance(term, LatestFilter)
-        and hasattr(term.inputs[0], "dataset")
-        and term.inputs[0].dataset.qualname == "SecuritiesMaster"
-        ):
-        field = term.inputs[0].name
-        op = "eq"
-        negate = False
-        values = [True]
-        return {"field": field, "op": op, "negate": negate, "values": values}
+    if isinstance(term, LatestFilter):
+        column = _securities_master_column(term)
+        if column is None:
+            return None
+        return {"field": column.name, "op": "eq", "negate": False, "values": [True]}
 
     # check if the term is a NullFilter or NotNullFilter of a SecuritiesMaster
     # column, e.g. SecuritiesMaster.alpaca_AssetId.latest.isnull()
-    if (isinstance(term, (NullFilter, NotNullFilter))
-        and isinstance(term.inputs[0], (LatestClassifier, LatestFactor))
-        and hasattr(term.inputs[0].inputs[0], "dataset")
-        and term.inputs[0].inputs[0].dataset.qualname == "SecuritiesMaster"):
-        field = term.inputs[0].inputs[0].name
-        op = "isnull"
-        negate = True if isinstance(term, NotNullFilter) else False
-        values = [True]
-        return {"field": field, "op": op, "negate": negate, "values": values}
+    if isinstance(term, (NullFilter, NotNullFilter)):
+        if not isinstance(term.inputs[0], (LatestClassifier, LatestFactor)):
+            return None
+        column = _securities_master_column(term.inputs[0])
+        if column is None:
+            return None
+        negate = isinstance(term, NotNullFilter)
+        return {"field": column.name, "op": "isnull", "negate": negate, "values": [True]}
 
     # isnull() on float columns are handled with a NumExprFilter
-    if (isinstance(term, NumExprFilter)
-        and term._expr == 'x_0 != x_0'
-        and isinstance(term.bindings["x_0"], LatestFactor)
-        and len(term.bindings["x_0"].inputs) == 1
-        and hasattr(term.bindings["x_0"].inputs[0], "dataset")
-        and term.bindings["x_0"].inputs[0].dataset.qualname == "SecuritiesMaster"):
-        field = term.bindings["x_0"].inputs[0].name
-        op = "isnull"
-        negate = False
-        values = [True]
-        return {"field": field, "op": op, "negate": negate, "values": values}
+    if isinstance(term, NumExprFilter) and term._expr == 'x_0 != x_0':
+        latest = term.inputs[0]
+        if not isinstance(latest, LatestFactor):
+            return None
+        column = _securities_master_column(latest)
+        if column is None:
+            return None
+        return {"field": column.name, "op": "isnull", "negate": False, "values": [True]}
 
     return None
 
@@ -151,22 +169,16 @@ def _term_to_prescreen_dict(term, prescreen=None, negate=False):
     prescreen = prescreen or {}
 
     if isinstance(term, SingleAsset):
-        if "sids" not in prescreen:
-            prescreen["sids"] = []
-        prescreen["sids"].append(term._asset.sid)
+        prescreen.setdefault("sids", []).append(term._asset.sid)
         return prescreen
 
     if isinstance(term, StaticAssets):
-        if "sids" not in prescreen:
-            prescreen["sids"] = []
-        prescreen["sids"].extend(term.params["sids"])
+        prescreen.setdefault("sids", []).extend(term.params["sids"])
         return prescreen
 
     # StaticSids and StaticUniverse store real sids in the sids param
     if isinstance(term, (StaticSids, StaticUniverse)):
-        if "real_sids" not in prescreen:
-            prescreen["real_sids"] = []
-        prescreen["real_sids"].extend(term.params["sids"])
+        prescreen.setdefault("real_sids", []).extend(term.params["sids"])
         return prescreen
 
     # check if the term is a negation of a SecuritiesMaster column, e.g.
@@ -175,16 +187,12 @@ def _term_to_prescreen_dict(term, prescreen=None, negate=False):
         isinstance(term, NumExprFilter)
         and term._expr == '~x_0'
         ):
-        fielddef = _term_to_prescreen_fielddef(term.bindings["x_0"])
+        fielddef = _term_to_prescreen_fielddef(term.inputs[0])
         if fielddef is not None:
-            # reverse the negate flag since the term has the unary operator
-            fielddef["negate"] = True if fielddef["negate"] == False else False
-            # negate it back if requested
-            if negate:
-                fielddef["negate"] = True if fielddef["negate"] == False else False
-            if "fields" not in prescreen:
-                prescreen["fields"] = []
-            prescreen["fields"].append(fielddef)
+            # reverse the negate flag since the term has the unary operator,
+            # unless it is to be negated back
+            fielddef["negate"] ^= not negate
+            prescreen.setdefault("fields", []).append(fielddef)
             return prescreen
 
     # check if the term is an ArrayPredicate of a SecuritiesMaster column, e.g.
@@ -192,11 +200,8 @@ def _term_to_prescreen_dict(term, prescreen=None, negate=False):
     fielddef = _term_to_prescreen_fielddef(term)
     if fielddef is not None:
         # negate if requested
-        if negate:
-            fielddef["negate"] = True if fielddef["negate"] == False else False
-        if "fields" not in prescreen:
-            prescreen["fields"] = []
-        prescreen["fields"].append(fielddef)
+        fielddef["negate"] ^= negate
+        prescreen.setdefault("fields", []).append(fielddef)
         return prescreen
 
     return None
@@ -321,39 +326,40 @@ class Pipeline(object):
             "includes multiple terms, they must be ANDed together; ORed terms are not "
             "supported."
         )
+        # Filters are immutable and memoized, so the same initial_universe
+        # always converts to the same prescreen. Each Pipeline gets its own
+        # copy so that no two pipelines share mutable state.
+        try:
+            return deepcopy(_prescreen_cache[initial_universe])
+        except KeyError:
+            pass
+
         # see if the initial_universe contains a single prescreenable term
         prescreen = _term_to_prescreen_dict(initial_universe)
-        if prescreen is not None:
-            return prescreen
 
         # if the screen is a NumExprFilter, see if it is an ANDed conjunction of
         # prescreenable terms (ORed expressions are not supported)
-        elif isinstance(initial_universe, NumExprFilter):
-
-            # ignore parantheses, which don't matter for ANDed expressions
-            expr = initial_universe._expr.replace("(", "").replace(")", "")
-            # split on AND and see if the resulting terms (possibly ignoring ~)
-            # match the screen bindings
-            terms = expr.split(" & ")
-            if set([term.replace("~", "") for term in terms]) == set(initial_universe.bindings):
+        if prescreen is None and isinstance(initial_universe, NumExprFilter):
+
+            # see if the expression is an AND of (possibly inverted) bindings
+            conjuncts = _and_conjuncts(initial_universe._expr)
+            bindings = initial_universe.bindings
+            if conjuncts is not None and set(name for name, _ in conjuncts) == set(bindings):
                 prescreen = {}
-                for term in terms:
-                    negate = "~" in term
-                    term = term.replace("~", "")
+                for name, negate in conjuncts:
                     prescreen = _term_to_prescreen_dict(
-                        initial_universe.bindings[term],
+                        bindings[name],
                         prescreen=prescreen,
                         negate=negate)
                     # if any term cannot be converted to a prescreen, bail out
                     if not prescreen:
-                        raise ValueError(ERROR_MSG.format(term=str(initial_universe.bindings[term])))
-
-                else:
-                    # didn't break loop, so prescreen is valid
-                    return prescreen
+                        raise ValueError(ERROR_MSG.format(term=str(bindings[name])))
 
+        if prescreen is None:
+            raise ValueError(ERROR_MSG.format(term=str(initial_universe)))
 
-        raise ValueError(ERROR_MSG.format(term=str(initial_universe)))
+        _prescreen_cache[initial_universe] = prescreen
+        return deepcopy(prescreen)
 
     @property
     def columns(self) -> dict[str, Term]:
@@ -550,12 +556,10 @@ class Pipeline(object):
 
     def _prepare_graph_terms(self, default_screen):
         """Helper for to_graph and to_execution_plan."""
-        columns = self.columns.copy()
         screen = self.screen
         if screen is None:
             screen = default_screen
-        columns[SCREEN_NAME] = screen
-        return columns
+        return {**self._columns, SCREEN_NAME: screen}
 
     @validate_call
     def show_graph(self, format: Literal['svg', 'png', 'jpeg'] = 'svg'):
@@ -593,7 +597,7 @@ class Pipeline(object):
         Includes all terms registered as data outputs of the pipeline, plus the
         screen, if present.
         """
-        terms = list(six.itervalues(self._columns))
+        terms = list(self._columns.values())
         screen = self.screen
         if screen is not None:
             terms.append(screen)
@@ -189,10 +189,12 @@ class dataframe_cache(MutableMapping):
     clean_on_failure : bool, optional
         Should the directory be cleaned up if an exception is raised in the
         context manager.
-    serialize : {'msgpack', 'pickle:<n>'}, optional
+    serialize : {'pickle:<n>', 'parquet'}, optional
         How should the data be serialized. If ``'pickle'`` is passed, an
         optional pickle protocol can be passed like: ``'pickle:3'`` which says
-        to use pickle protocol 3.
+        to use pickle protocol 3. ``'parquet'`` stores each value with
+        :meth:`pandas.DataFrame.to_parquet`, which requires a parquet engine
+        such as pyarrow and only supports DataFrames.
 
     Notes
     -----
@@ -211,14 +213,18 @@ class dataframe_cache(MutableMapping):
         self.clean_on_failure = clean_on_failure
 
         s = serialization.split(':', 1)
-        if s[0] != 'pickle':
+        if s == ['parquet']:
+            self.serialize = self._serialize_parquet
+            self.deserialize = pd.read_parquet
+        elif s[0] == 'pickle':
+            self._protocol = int(s[1]) if len(s) == 2 else None
+
+            self.serialize = self._serialize_pickle
+            self.deserialize = partial(pickle.load, encoding='latin-1')
+        else:
             raise ValueError(
-                "'serialization' must be 'pickle[:n]'",
+                "'serialization' must be 'pickle[:n]' or 'parquet'",
             )
-        self._protocol = int(s[1]) if len(s) == 2 else None
-
-        self.serialize = self._serialize_pickle
-        self.deserialize = partial(pickle.load, encoding='latin-1')
 
         ensure_directory(self.path)
 
@@ -229,6 +235,9 @@ class dataframe_cache(MutableMapping):
         with open(path, 'wb') as f:
             pickle.dump(df, f, protocol=self._protocol)
 
+    def _serialize_parquet(self, df, path):
+        df.to_parquet(path)
+
     def _keypath(self, key):
         return os.path.join(self.path, key)
 
@@ -466,6 +466,61 @@ def vectorized_is_element(array, choices):
     return vectorize(choices.__contains__, otypes=[bool])(array)
 
 
+def is_element_lookup_table(array, choices):
+    """
+    Check if each element of an integer ``array`` is in ``choices``.
+
+    This builds a boolean lookup table spanning ``min(choices)`` through
+    ``max(choices)`` and indexes it with ``array``, so it should only be used
+    when ``choices`` is a non-empty set of ints covering a small range.
+
+    Parameters
+    ----------
+    array : np.ndarray[int64]
+    choices : set[int]
+
+    Returns
+    -------
+    was_element : np.ndarray[bool]
+        Array indicating whether each element of ``array`` was in ``choices``.
+    """
+    low = min(choices)
+    high = max(choices)
+
+    table = np.zeros(high - low + 1, dtype=bool)
+    values = np.fromiter(choices, dtype=int64_dtype, count=len(choices))
+    table[values - low] = True
+
+    in_range = (array >= low) & (array <= high)
+    return table[np.where(in_range, array - low, 0)] & in_range
+
+
+def is_element_searchsorted(array, choices):
+    """
+    Check if each element of an integer ``array`` is in ``choices``.
+
+    This binary searches a sorted array of ``choices`` for each element of
+    ``array``, so it works for any non-empty set of ints that fit in an int64,
+    however sparse.
+
+    Parameters
+    ----------
+    array : np.ndarray[int64]
+    choices : set[int]
+
+    Returns
+    -------
+    was_element : np.ndarray[bool]
+        Array indicating whether each element of ``array`` was in ``choices``.
+    """
+    values = np.fromiter(choices, dtype=int64_dtype, count=len(choices))
+    values.sort()
+
+    locs = values.searchsorted(array)
+    np.minimum(locs, len(values) - 1, out=locs)
+    return values[locs] == array
+
+
 def as_column(a):
     """
     Convert an array of shape (N,) into an array of shape (N, 1).
@@ -4,7 +4,6 @@ Canonical path locations for zipline data.
 Paths are rooted at $ZIPLINE_ROOT if that environment variable is set.
 Otherwise default to expanduser(~/.zipline)
 """
-from errno import EEXIST
 import os
 from os.path import exists, expanduser, join
 
@@ -26,12 +25,7 @@ def ensure_directory(path):
     """
     Ensure that a directory named "path" exists.
     """
-    try:
-        os.makedirs(path)
-    except OSError as exc:
-        if exc.errno == EEXIST and os.path.isdir(path):
-            return
-        raise
+    os.makedirs(path, exist_ok=True)
 
 
 def ensure_directory_containing(path):
@@ -207,7 +201,7 @@ def data_path(paths, environ=None):
     newpath : str
         The requested path joined with the zipline data root.
     """
-    return zipline_path(['data'] + list(paths), environ=environ)
+    return join(zipline_root(environ=environ), 'data', *paths)
 
 
 def cache_root(environ=None):
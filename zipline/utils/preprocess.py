@@ -88,6 +88,10 @@ def preprocess(*_unused, **processors):
     if _unused:
         raise TypeError("preprocess() doesn't accept positional arguments")
 
+    if not processors:
+        # Nothing to apply, so there's no reason to rebuild the function.
+        return _identity_decorator
+
     def _decorator(f):
         # inspect f.raw_function if f has a raw_function attr. This is the case
         # for functions decorated with pydantic.validate_call. Pydantic moves the
@@ -124,6 +128,10 @@ def preprocess(*_unused, **processors):
     return _decorator
 
 
+def _identity_decorator(f):
+    return f
+
+
 def call(f):
     """
     Wrap a function in a processor that calls `f` on the argument before